@@ -16,26 +16,54 @@ __version__ = "0.3.0"
 __author__ = "Yaswanth Narvaneni"
 __email__ = "yaswanth@gmail.com"
 
-from .client import AgentClient
+from typing import TYPE_CHECKING, Dict, Tuple
 
-# Import available exceptions
-from .exceptions import AgentServerError, AuthenticationError, CapabilityError
+from .common.lazy import lazy_attributes
 
-# Import core functionality
-from .parser import AgentUri, parse_agent_uri
-from .server import FastAPIAgentServer
+if TYPE_CHECKING:
+    from .client import AgentClient  # noqa: F401
+    from .exceptions import (  # noqa: F401
+        AgentServerError,
+        AuthenticationError,
+        CapabilityError,
+    )
+    from .parser import AgentUri, parse_agent_uri  # noqa: F401
+    from .server import FastAPIAgentServer  # noqa: F401
 
-__all__ = [
-    "AgentUri",
-    "parse_agent_uri",
-    "AgentClient",
-    "FastAPIAgentServer",
-    "AgentServerError",
-    "CapabilityError",
-    "AuthenticationError",
-]
+# Maps each public name to the submodule that defines it. Submodules are
+# imported on first attribute access (PEP 562), so e.g. the CLI's parse
+# command does not pull in FastAPI through the server module.
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "AgentUri": ("parser", "AgentUri"),
+    "parse_agent_uri": ("parser", "parse_agent_uri"),
+    "AgentClient": ("client", "AgentClient"),
+    "FastAPIAgentServer": ("server", "FastAPIAgentServer"),
+    "AgentServerError": ("exceptions", "AgentServerError"),
+    "CapabilityError": ("exceptions", "CapabilityError"),
+    "AuthenticationError": ("exceptions", "AuthenticationError"),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+# Submodules that importing the package used to load eagerly; they stay
+# reachable as attributes, e.g. agent_uri.parser, after a bare import
+_LAZY_SUBMODULES = (
+    "auth",
+    "capability",
+    "client",
+    "descriptor",
+    "exceptions",
+    "handler",
+    "parser",
+    "resolver",
+    "server",
+    "transport",
+)
 
 
 def get_version():
     """Get the version of the agent-uri package."""
     return __version__
+
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES, _LAZY_SUBMODULES)
@@ -17,6 +17,17 @@ from .exceptions import CapabilityError, InvalidInputError
 
 logger = logging.getLogger(__name__)
 
+# JSON Schema type names mapped to the Python types used for input models
+_SCHEMA_TYPE_MAP: Dict[str, Type[Any]] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
 
 class CapabilityMetadata:
     """Metadata for an agent capability."""
@@ -187,6 +198,14 @@ class Capability:
         # Determine if function is async
         self.is_async = asyncio.iscoroutinefunction(func)
 
+        # Inspect the signature once; invoke() consults these on every call
+        try:
+            parameter_names = set(inspect.signature(func).parameters)
+        except (TypeError, ValueError):
+            parameter_names = set()
+        self.accepts_session_id = "session_id" in parameter_names
+        self.accepts_context = "context" in parameter_names
+
         # Create input validation model if schema provided
         self.input_model = (
             self._create_input_model() if self.metadata.input_schema else None
@@ -247,16 +266,7 @@ class Capability:
         Returns:
             Corresponding Python type
         """
-        type_map: Dict[str, Type[Any]] = {
-            "string": str,
-            "integer": int,
-            "number": float,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-            "null": type(None),
-        }
-        return type_map.get(schema_type, cast(Type[Any], Any))
+        return _SCHEMA_TYPE_MAP.get(schema_type, cast(Type[Any], Any))
 
     def validate_input(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -275,8 +285,10 @@ class Capability:
             return data
 
         try:
-            validated = self.input_model(**data)
-            return validated.dict()
+            # The model's validator is built once per capability; validating
+            # the dict directly avoids unpacking it into keyword arguments
+            validated = self.input_model.model_validate(data)
+            return validated.model_dump()
         except ValidationError as e:
             raise InvalidInputError(f"Input validation failed: {str(e)}")
         except Exception as e:
@@ -318,8 +330,7 @@ class Capability:
                     self.sessions[session_id] = {"created_at": uuid.uuid4().hex}
 
                 # Add session_id to params if function expects it
-                sig = inspect.signature(self.func)
-                if "session_id" in sig.parameters:
+                if self.accepts_session_id:
                     # Add a defensive check to detect possible parameter duplication
                     if "session_id" in kwargs:
                         logger.warning(
@@ -333,7 +344,7 @@ class Capability:
                     validated_params["session_id"] = session_id
 
                 # Add session context if function expects it
-                if "context" in sig.parameters:
+                if self.accepts_context:
                     session_context = (
                         self.sessions.get(session_id, {}) if self.sessions else {}
                     )
@@ -13,10 +13,10 @@ import sys
 from typing import Any
 
 from . import __version__
-from .client import AgentClient
-from .exceptions import AgentClientError
 from .parser import AgentUriError, parse_agent_uri
-from .resolver.resolver import AgentResolver
+
+# The client and resolver (and the HTTP stack behind them) are imported by
+# the commands that use them, so parse, version and --help start quickly
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -138,6 +138,8 @@ async def cmd_parse(args: argparse.Namespace) -> int:
 async def cmd_resolve(args: argparse.Namespace) -> int:
     """Handle the resolve command."""
     try:
+        from .resolver.resolver import AgentResolver
+
         resolver = AgentResolver()
         descriptor, metadata = resolver.resolve(args.uri)
 
@@ -160,6 +162,9 @@ async def cmd_resolve(args: argparse.Namespace) -> int:
 
 async def cmd_invoke(args: argparse.Namespace) -> int:
     """Handle the invoke command."""
+    from .client import AgentClient
+    from .exceptions import AgentClientError
+
     try:
         # Parse parameters
         params = {}
@@ -202,6 +207,8 @@ async def cmd_invoke(args: argparse.Namespace) -> int:
 async def cmd_describe(args: argparse.Namespace) -> int:
     """Handle the describe command."""
     try:
+        from .resolver.resolver import AgentResolver
+
         resolver = AgentResolver()
         descriptor, _ = resolver.resolve(args.uri)
 
@@ -4,34 +4,53 @@ Error handling framework for agent:// protocol.
 This module provides a standardized error handling system that implements
 RFC 7807 (Problem Details for HTTP APIs) for structured error responses
 across different transport bindings.
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+importing the package does not load the transport helpers until they are
+actually used.
 """
 
-from .models import (
-    AgentError,
-    AgentProblemDetail,
-    ErrorCategory,
-    create_problem_detail,
-    problem_from_exception,
-)
-from .transport import (
-    format_for_http,
-    format_for_local,
-    format_for_websocket,
-    parse_http_error,
-    parse_local_error,
-    parse_websocket_error,
-)
-
-__all__ = [
-    "AgentError",
-    "AgentProblemDetail",
-    "ErrorCategory",
-    "create_problem_detail",
-    "problem_from_exception",
-    "format_for_http",
-    "format_for_websocket",
-    "format_for_local",
-    "parse_http_error",
-    "parse_websocket_error",
-    "parse_local_error",
-]
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from ..lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .models import (  # noqa: F401
+        AgentError,
+        AgentProblemDetail,
+        ErrorCategory,
+        create_problem_detail,
+        problem_from_exception,
+    )
+    from .transport import (  # noqa: F401
+        format_for_all,
+        format_for_http,
+        format_for_local,
+        format_for_websocket,
+        parse_http_error,
+        parse_local_error,
+        parse_websocket_error,
+    )
+
+# Maps each public name to the submodule that defines it
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "AgentError": ("models", "AgentError"),
+    "AgentProblemDetail": ("models", "AgentProblemDetail"),
+    "ErrorCategory": ("models", "ErrorCategory"),
+    "create_problem_detail": ("models", "create_problem_detail"),
+    "problem_from_exception": ("models", "problem_from_exception"),
+    "format_for_http": ("transport", "format_for_http"),
+    "format_for_websocket": ("transport", "format_for_websocket"),
+    "format_for_local": ("transport", "format_for_local"),
+    "format_for_all": ("transport", "format_for_all"),
+    "parse_http_error": ("transport", "parse_http_error"),
+    "parse_websocket_error": ("transport", "parse_websocket_error"),
+    "parse_local_error": ("transport", "parse_local_error"),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+# Submodules that importing the package used to load eagerly
+_LAZY_SUBMODULES = ("models", "transport")
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES, _LAZY_SUBMODULES)
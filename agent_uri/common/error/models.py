@@ -7,7 +7,7 @@ error structures that can be used across different transport bindings.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 
 class ErrorCategory(Enum):
@@ -49,6 +49,17 @@ HTTP_STATUS_CODES = {
     ErrorCategory.VALIDATION_ERROR: 422,
 }
 
+# Default (type URI, title, HTTP status) for each category, computed once
+# rather than rebuilt from the enum name for every error
+_CATEGORY_DEFAULTS: Dict[ErrorCategory, Tuple[str, str, int]] = {
+    category: (
+        f"https://agent-uri.org/errors/{category.name.lower()}",
+        category.name.replace("_", " ").title(),
+        HTTP_STATUS_CODES.get(category, 500),
+    )
+    for category in ErrorCategory
+}
+
 
 @dataclass
 class AgentProblemDetail:
@@ -112,20 +123,19 @@ class AgentError(Exception):
             extensions: Additional fields to include in the problem detail
         """
         super().__init__(message)
+        default_type, _, default_status = _CATEGORY_DEFAULTS[category]
         self.message = message
         self.category = category
-        self.type_uri = (
-            type_uri or f"https://agent-uri.org/errors/{category.name.lower()}"
-        )
+        self.type_uri = type_uri or default_type
         self.instance = instance
-        self.status = status or HTTP_STATUS_CODES.get(category, 500)
+        self.status = status or default_status
         self.extensions = extensions or {}
 
     def to_problem_detail(self) -> AgentProblemDetail:
         """Convert this error to an RFC 7807 problem detail."""
         return AgentProblemDetail(
             type=self.type_uri,
-            title=self.category.name.replace("_", " ").title(),
+            title=_CATEGORY_DEFAULTS[self.category][1],
             status=self.status,
             detail=self.message,
             instance=self.instance,
@@ -155,14 +165,12 @@ def create_problem_detail(
     Returns:
         An AgentProblemDetail instance
     """
-    type_uri = type_uri or f"https://agent-uri.org/errors/{category.name.lower()}"
-    status = status or HTTP_STATUS_CODES.get(category, 500)
-    title = category.name.replace("_", " ").title()
+    default_type, title, default_status = _CATEGORY_DEFAULTS[category]
 
     return AgentProblemDetail(
-        type=type_uri,
+        type=type_uri or default_type,
         title=title,
-        status=status,
+        status=status or default_status,
         detail=detail,
         instance=instance,
         extensions=extensions or {},
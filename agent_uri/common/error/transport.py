@@ -10,15 +10,29 @@ from typing import Any, Dict, Optional, Tuple, Union
 
 from .models import AgentError, AgentProblemDetail
 
+# A problem detail, or the dict its to_dict() already produced. Formatting one
+# error for several transports can serialize it once and pass the dict along.
+ProblemLike = Union[AgentProblemDetail, Dict[str, Any]]
+
+# (headers, status_code, response_body) as returned by format_for_http
+HttpErrorResponse = Tuple[Dict[str, str], int, Dict[str, Any]]
+
+
+def _problem_body(problem: ProblemLike) -> Dict[str, Any]:
+    """Return the serialized form of a problem detail."""
+    if isinstance(problem, AgentProblemDetail):
+        return problem.to_dict()
+    return problem
+
 
 def format_for_http(
-    problem: AgentProblemDetail, headers: Optional[Dict[str, str]] = None
-) -> Tuple[Dict[str, str], int, Dict[str, Any]]:
+    problem: ProblemLike, headers: Optional[Dict[str, str]] = None
+) -> HttpErrorResponse:
     """
     Format a problem detail for HTTP responses.
 
     Args:
-        problem: The problem detail to format
+        problem: The problem detail to format, or its to_dict() output
         headers: Optional additional headers to include in the response
 
     Returns:
@@ -29,33 +43,61 @@ def format_for_http(
     if headers:
         all_headers.update(headers)
 
-    return all_headers, problem.status, problem.to_dict()
+    if isinstance(problem, AgentProblemDetail):
+        return all_headers, problem.status, problem.to_dict()
+    return all_headers, problem["status"], problem
 
 
-def format_for_websocket(problem: AgentProblemDetail) -> Dict[str, Any]:
+def format_for_websocket(problem: ProblemLike) -> Dict[str, Any]:
     """
     Format a problem detail for WebSocket responses.
 
     Args:
-        problem: The problem detail to format
+        problem: The problem detail to format, or its to_dict() output
 
     Returns:
         A JSON-serializable dict representing the error
     """
-    return {"error": problem.to_dict()}
+    return {"error": _problem_body(problem)}
 
 
-def format_for_local(problem: AgentProblemDetail) -> Dict[str, Any]:
+def format_for_local(problem: ProblemLike) -> Dict[str, Any]:
     """
     Format a problem detail for local transport (e.g., IPC) responses.
 
     Args:
-        problem: The problem detail to format
+        problem: The problem detail to format, or its to_dict() output
 
     Returns:
         A JSON-serializable dict representing the error
     """
-    return {"error": problem.to_dict()}
+    return {"error": _problem_body(problem)}
+
+
+def format_for_all(
+    problem: AgentProblemDetail, headers: Optional[Dict[str, str]] = None
+) -> Tuple[HttpErrorResponse, Dict[str, Any], Dict[str, Any]]:
+    """
+    Format a problem detail for the HTTP, WebSocket and local transports at once.
+
+    The problem is serialized a single time and the resulting body is shared
+    by all three responses, so callers must not mutate it.
+
+    Args:
+        problem: The problem detail to format
+        headers: Optional additional headers to include in the HTTP response
+
+    Returns:
+        A tuple of (http_response, websocket_message, local_message), as
+        returned by format_for_http, format_for_websocket and format_for_local
+    """
+    body = problem.to_dict()
+    http_headers, _, _ = format_for_http(body, headers)
+    return (
+        (http_headers, problem.status, body),
+        format_for_websocket(body),
+        format_for_local(body),
+    )
 
 
 def parse_http_error(
@@ -0,0 +1,47 @@
+"""
+Lazy package attribute helpers shared across the agent:// protocol packages.
+"""
+
+import importlib
+from typing import Any, Callable, Collection, Dict, List, Mapping, Tuple
+
+
+def lazy_attributes(
+    module_globals: Dict[str, Any],
+    attributes: Mapping[str, Tuple[str, str]],
+    submodules: Collection[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build PEP 562 ``__getattr__`` and ``__dir__`` hooks for a package.
+
+    ``attributes`` maps each public name to the ``(submodule, attribute)``
+    pair that defines it. The submodule is imported on first access and the
+    value cached in ``module_globals``, so later lookups skip the hook.
+    Names in ``submodules`` resolve to the submodule itself, so code that
+    reaches them as package attributes without importing them still works.
+
+    Packages should also import the same names under ``TYPE_CHECKING`` so
+    static type checkers see the real types instead of ``Any``.
+    """
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        """Import the submodule providing ``name`` on first access."""
+        if name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            try:
+                module_name, attribute = attributes[name]
+            except KeyError:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+            module = importlib.import_module(f".{module_name}", package)
+            value = getattr(module, attribute)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        """Include lazily imported names in ``dir()`` output."""
+        return sorted(set(module_globals) | set(attributes) | set(submodules))
+
+    return __getattr__, __dir__
@@ -0,0 +1,28 @@
+"""
+Dataclass helpers shared across the agent:// protocol packages.
+"""
+
+from dataclasses import fields
+from typing import Type, TypeVar, cast
+
+_T = TypeVar("_T")
+
+
+def slotted(cls: Type[_T]) -> Type[_T]:
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10.
+    Instances then carry no per-object ``__dict__``.
+    """
+    field_names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    namespace = dict(cls.__dict__)
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = field_names
+
+    slotted_cls = cast(Type[_T], type(cls.__name__, cls.__bases__, namespace))
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
@@ -125,6 +125,18 @@ class TestErrorModels(unittest.TestCase):
         self.assertEqual(problem.status, 500)
         self.assertEqual(problem.detail, "Invalid value")
 
+    def test_package_exports_resolve_lazily(self):
+        """Test that the error package exposes the submodule names on access."""
+        from .. import error
+
+        for name in error.__all__:
+            self.assertIn(name, dir(error))
+            self.assertIsNotNone(getattr(error, name))
+
+        self.assertIs(error.AgentError, AgentError)
+        with self.assertRaises(AttributeError):
+            error.does_not_exist  # noqa: B018
+
 
 if __name__ == "__main__":
     unittest.main()
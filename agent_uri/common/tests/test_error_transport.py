@@ -7,6 +7,7 @@ import unittest
 
 from ..error.models import AgentProblemDetail, ErrorCategory, create_problem_detail
 from ..error.transport import (
+    format_for_all,
     format_for_http,
     format_for_local,
     format_for_websocket,
@@ -76,6 +77,27 @@ class TestErrorTransport(unittest.TestCase):
         self.assertEqual(error["detail"], "The requested capability was not found.")
         self.assertEqual(error["instance"], "/planner/generate-itinerary")
 
+    def test_format_from_serialized_problem(self):
+        """Test that formatters accept an already serialized problem detail."""
+        body = self.problem.to_dict()
+
+        self.assertEqual(format_for_http(body), format_for_http(self.problem))
+        self.assertIs(format_for_http(body)[2], body)
+        self.assertIs(format_for_websocket(body)["error"], body)
+        self.assertIs(format_for_local(body)["error"], body)
+
+    def test_format_for_all(self):
+        """Test formatting a problem detail for every transport at once."""
+        http, websocket, local = format_for_all(self.problem, {"X-Request-ID": "1"})
+
+        self.assertEqual(http, format_for_http(self.problem, {"X-Request-ID": "1"}))
+        self.assertEqual(websocket, format_for_websocket(self.problem))
+        self.assertEqual(local, format_for_local(self.problem))
+
+        # The serialized body is computed once and shared
+        self.assertIs(websocket["error"], http[2])
+        self.assertIs(local["error"], http[2])
+
     def test_parse_http_error_with_problem_json(self):
         """Test parsing an HTTP error with problem+json content type."""
         body = {
@@ -147,6 +169,22 @@ class TestErrorTransport(unittest.TestCase):
         self.assertEqual(problem.status, 404)
         self.assertEqual(problem.detail, "Resource not found")
 
+    def test_parse_error_bodies_follow_stdlib_json(self):
+        """Test error bodies with NaN and big integers decode like json.loads."""
+        headers = {"Content-Type": "application/json"}
+        body = '{"message": "Overflow", "limit": 123456789012345678901234567890}'
+
+        problem = parse_http_error(400, body, headers)
+
+        self.assertIsNotNone(problem)
+        self.assertEqual(problem.detail, "Overflow")
+        self.assertEqual(problem.extensions["limit"], 123456789012345678901234567890)
+
+        problem = parse_websocket_error('{"error": "Bad score", "score": NaN}')
+
+        self.assertIsNotNone(problem)
+        self.assertEqual(problem.detail, "Bad score")
+
     def test_parse_http_error_with_text(self):
         """Test parsing an HTTP error with text/plain content type."""
         body = "Internal server error occurred"
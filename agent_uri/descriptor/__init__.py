@@ -3,23 +3,57 @@ Agent Descriptor package for parsing and validating agent.json descriptors.
 
 This package provides utilities to work with agent.json descriptors
 as defined in the agent:// protocol specification.
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+importing the package does not pull in the validator or generator until
+they are actually used.
 """
 
+from typing import TYPE_CHECKING, Dict, Tuple
+
 # Import version from main package
 from .. import __version__  # noqa: F401
-from .compatibility import from_agent_card, to_agent_card  # noqa: F401
-from .generator import AgentDescriptorGenerator  # noqa: F401
-from .models import (  # noqa: F401
-    AgentDescriptor,
-    Authentication,
-    Capability,
-    Provider,
-    Skill,
-)
-from .parser import load_descriptor, parse_descriptor  # noqa: F401
-from .validator import (  # noqa: F401
-    ValidationError,
-    ValidationResult,
-    validate_descriptor,
-    validate_required_fields,
-)
+from ..common.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .compatibility import from_agent_card, to_agent_card  # noqa: F401
+    from .generator import AgentDescriptorGenerator  # noqa: F401
+    from .models import (  # noqa: F401
+        AgentDescriptor,
+        Authentication,
+        Capability,
+        Provider,
+        Skill,
+    )
+    from .parser import load_descriptor, parse_descriptor  # noqa: F401
+    from .validator import (  # noqa: F401
+        ValidationError,
+        ValidationResult,
+        validate_descriptor,
+        validate_required_fields,
+    )
+
+# Maps each public name to the submodule that defines it
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "from_agent_card": ("compatibility", "from_agent_card"),
+    "to_agent_card": ("compatibility", "to_agent_card"),
+    "AgentDescriptorGenerator": ("generator", "AgentDescriptorGenerator"),
+    "AgentDescriptor": ("models", "AgentDescriptor"),
+    "Authentication": ("models", "Authentication"),
+    "Capability": ("models", "Capability"),
+    "Provider": ("models", "Provider"),
+    "Skill": ("models", "Skill"),
+    "load_descriptor": ("parser", "load_descriptor"),
+    "parse_descriptor": ("parser", "parse_descriptor"),
+    "ValidationError": ("validator", "ValidationError"),
+    "ValidationResult": ("validator", "ValidationResult"),
+    "validate_descriptor": ("validator", "validate_descriptor"),
+    "validate_required_fields": ("validator", "validate_required_fields"),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+# Submodules that importing the package used to load eagerly
+_LAZY_SUBMODULES = ("compatibility", "generator", "models", "parser", "validator")
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES, _LAZY_SUBMODULES)
@@ -8,7 +8,10 @@ as specified in the agent:// protocol RFC Section 7.
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
+from ..common.slots import slotted
 
+
+@slotted
 @dataclass
 class Provider:
     """Information about the provider of the agent."""
@@ -17,6 +20,7 @@ class Provider:
     url: Optional[str] = None
 
 
+@slotted
 @dataclass
 class ContentTypes:
     """Content type information for a capability."""
@@ -25,6 +29,7 @@ class ContentTypes:
     output_format: List[str] = field(default_factory=list)
 
 
+@slotted
 @dataclass
 class Example:
     """Example invocation of a capability."""
@@ -34,6 +39,7 @@ class Example:
     description: Optional[str] = None
 
 
+@slotted
 @dataclass
 class Capability:
     """A capability offered by an agent."""
@@ -56,6 +62,7 @@ class Capability:
     examples: List[Example] = field(default_factory=list)
 
 
+@slotted
 @dataclass
 class Authentication:
     """Authentication methods supported by the agent."""
@@ -64,6 +71,7 @@ class Authentication:
     details: Optional[Dict[str, Any]] = None
 
 
+@slotted
 @dataclass
 class Skill:
     """A skill the agent possesses, which may map to multiple capabilities."""
@@ -77,6 +85,7 @@ class Skill:
     output_modes: Optional[List[str]] = None
 
 
+@slotted
 @dataclass
 class Endpoints:
     """Transport-specific endpoints for the agent."""
@@ -86,6 +95,7 @@ class Endpoints:
     local: Optional[str] = None
 
 
+@slotted
 @dataclass
 class Contact:
     """Contact information for the agent provider."""
@@ -95,6 +105,7 @@ class Contact:
     url: Optional[str] = None
 
 
+@slotted
 @dataclass
 class AgentCapabilities:
     """Capabilities configuration for A2A compatibility."""
@@ -104,6 +115,7 @@ class AgentCapabilities:
     state_transition_history: bool = False
 
 
+@slotted
 @dataclass
 class AgentDescriptor:
     """
@@ -220,3 +220,20 @@ def test_save_descriptor():
         assert saved_data["version"] == "1.0.0"
         assert len(saved_data["capabilities"]) == 1
         assert saved_data["capabilities"][0]["name"] == "save-capability"
+
+
+def test_descriptor_models_use_slots():
+    """Test that parsed descriptor objects have no per-instance __dict__."""
+    descriptor = parse_descriptor(
+        {
+            "name": "slots-agent",
+            "version": "1.0.0",
+            "capabilities": [{"name": "slots-capability"}],
+            "provider": {"organization": "Test Org"},
+        }
+    )
+
+    for obj in (descriptor, descriptor.capabilities[0], descriptor.provider):
+        assert not hasattr(obj, "__dict__")
+
+    assert descriptor == parse_descriptor(descriptor_to_dict(descriptor))
@@ -5,11 +5,37 @@ Implementation of the agent:// URI parser according to the ABNF specification
 in Section 4 of the RFC draft.
 """
 
+import ipaddress
 import re
+import string
 import urllib.parse
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .common.slots import slotted
+
+# RFC 3986 appendix B decomposition, specialised to the agent scheme: the
+# groups are transport, authority, path, query and fragment
+_AGENT_URI_RE = re.compile(
+    r"agent(?:\+([a-zA-Z0-9\-]+))?://([^/?#]*)([^?#]*)(?:\?([^#]*))?(?:#(.*))?",
+    re.ASCII | re.DOTALL,
+)
+
+# Transport bindings allowed after "agent+", mapped to their shared string
+# constants so parsed URIs reuse one object per transport name
+_VALID_TRANSPORTS = {
+    name: name for name in ("https", "http", "wss", "ws", "local", "unix", "matrix")
+}
+
+# RFC 3986 "IPvFuture" literal, the only bracketed host that is not IPv6
+_IPV_FUTURE_RE = re.compile(r"v[a-fA-F0-9]+\..+", re.DOTALL)
+
+# Characters urllib.parse.quote leaves untouched with its default safe="/"
+_QUOTE_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "_.-~/")
+
+# urllib silently drops tabs and newlines from URLs; keep doing the same
+_STRIP_UNSAFE_CHARS = str.maketrans("", "", "\t\r\n")
 
 
 class AgentUriError(Exception):
@@ -18,6 +44,7 @@ class AgentUriError(Exception):
     pass
 
 
+@slotted
 @dataclass
 class AgentUri:
     """
@@ -64,44 +91,30 @@ class AgentUri:
             if self.userinfo:
                 authority = f"{self.userinfo}@{authority}"
 
-        # Build query string
-        query_str = ""
-        if self.query:
-            params = []
-            for key, value in self.query.items():
-                if isinstance(value, list):
-                    for v in value:
-                        # Special handling for '+' character preservation
-                        encoded_value = urllib.parse.quote(str(v))
-                        if "+" in str(v):
-                            encoded_value = encoded_value.replace("%2B", "+")
-                        params.append(f"{urllib.parse.quote(key)}={encoded_value}")
-                else:
-                    # Special handling for '+' character preservation
-                    encoded_value = urllib.parse.quote(str(value))
-                    if "+" in str(value):
-                        encoded_value = encoded_value.replace("%2B", "+")
-                    params.append(f"{urllib.parse.quote(key)}={encoded_value}")
-            if params:
-                query_str = "&".join(params)
-
-        # Build the full URI
-        uri = f"{self.full_scheme}://{authority}"
+        # Collect the pieces and join them once at the end
+        parts = [self.full_scheme, "://", authority]
 
         if self.path:
             # Make sure path starts with a slash if not empty
             if not self.path.startswith("/"):
-                uri += f"/{self.path}"
-            else:
-                uri += self.path
+                parts.append("/")
+            parts.append(self.path)
 
-        if query_str:
-            uri += f"?{query_str}"
+        if self.query:
+            params = []
+            for key, value in self.query.items():
+                encoded_key = _quote(key)
+                for v in value if isinstance(value, list) else (value,):
+                    params.append(f"{encoded_key}={_quote_query_value(str(v))}")
+            if params:
+                parts.append("?")
+                parts.append("&".join(params))
 
         if self.fragment:
-            uri += f"#{self.fragment}"
+            parts.append("#")
+            parts.append(self.fragment)
 
-        return uri
+        return "".join(parts)
 
     def __str__(self) -> str:
         """String representation is the full URI."""
@@ -140,6 +153,25 @@ class AgentUri:
         return parse_agent_uri(uri)
 
 
+def _quote(value: str) -> str:
+    """Percent-encode like urllib.parse.quote, skipping it if nothing needs it."""
+    if _QUOTE_SAFE_CHARS.issuperset(value):
+        return value
+    return urllib.parse.quote(value)
+
+
+def _quote_query_value(value: str) -> str:
+    """Percent-encode a query value, leaving '+' characters as they are."""
+    encoded_value = _quote(value)
+    if "+" in value:
+        encoded_value = encoded_value.replace("%2B", "+")
+    return encoded_value
+
+
+# Upper bound on the number of distinct URI strings whose parse is cached
+PARSE_CACHE_SIZE = 4096
+
+
 def parse_agent_uri(uri: str) -> AgentUri:
     """
     Parse an agent:// URI according to the protocol specification.
@@ -157,60 +189,71 @@ def parse_agent_uri(uri: str) -> AgentUri:
     Raises:
         AgentUriError: If the URI doesn't follow the agent:// scheme format
     """
+    (
+        transport,
+        authority,
+        path,
+        query,
+        fragment,
+        userinfo,
+        host,
+        port,
+    ) = _parse_components(uri)
+
+    # The cached query dict is shared, so hand each caller its own copy
+    query_params = {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in query.items()
+    }
+
+    return AgentUri(
+        scheme="agent",
+        transport=transport,
+        authority=authority,
+        path=path,
+        query=query_params,
+        fragment=fragment,
+        userinfo=userinfo,
+        host=host,
+        port=port,
+    )
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_components(uri: str) -> Tuple[Any, ...]:
+    """
+    Parse a URI string into its AgentUri field values.
+
+    The result is cached per URI string, so repeated parses of the same URI
+    skip the regex and query decoding work. Invalid URIs raise and are not cached.
+    """
     # Check if the URI has the agent scheme
     if not uri.startswith("agent"):
         raise AgentUriError(f"URI must start with 'agent': {uri}")
 
-    # Extract transport binding if present
-    transport = None
-    scheme_regex = r"^agent(\+([a-zA-Z0-9\-]+))?://"
-    match = re.match(scheme_regex, uri)
-
+    # Split the URI into its components in a single regex pass
+    match = _AGENT_URI_RE.match(uri)
+    if match and ("\t" in uri or "\r" in uri or "\n" in uri):
+        # Tabs and newlines fail the scheme above; elsewhere urllib drops them
+        match = _AGENT_URI_RE.match(uri.translate(_STRIP_UNSAFE_CHARS))
     if not match:
         raise AgentUriError(f"Invalid agent URI format: {uri}")
+    transport, netloc, path, query, fragment = match.groups()
 
-    # Extract the transport protocol if it exists
-    if match.group(1):  # This captures the "+transport" part
-        transport = match.group(2)  # This captures just the "transport" part
-        # Validate transport protocol - only allow certain protocols
-        valid_protocols = ["https", "http", "wss", "ws", "local", "unix", "matrix"]
-        if transport not in valid_protocols:
+    # Validate the transport protocol if there is one - only allow certain protocols
+    if transport is not None:
+        if transport not in _VALID_TRANSPORTS:
             raise AgentUriError(f"Invalid transport protocol: {transport}")
-
-    # Replace the scheme with 'http' temporarily to use urllib.parse
-    # This is because urllib.parse doesn't support custom schemes as well
-    normalized_uri = re.sub(r"^agent(\+[a-zA-Z0-9\-]+)?://", "http://", uri)
-
-    # Parse the normalized URI
-    parsed = urlparse(normalized_uri)
+        transport = _VALID_TRANSPORTS[transport]
 
     # Special handling for agent:///planning case (missing authority)
-    if not parsed.netloc and parsed.path:
+    if not netloc and path:
         raise AgentUriError("Missing authority in agent URI")
 
+    _check_brackets(netloc)
+
     # Extract query parameters
-    query_params: Dict[str, Union[str, List[str]]] = {}
-    if parsed.query:
-        # Split the query string manually to preserve '+' characters
-        # which parse_qs would decode to spaces
-        for param in parsed.query.split("&"):
-            if "=" in param:
-                key, value = param.split("=", 1)
-                key = urllib.parse.unquote(key)
-                # Don't decode '+' to space for 'q=hello+world' case
-                if "+" in value and "%2B" not in param:
-                    value = urllib.parse.unquote(value.replace("+", "%2B"))
-                else:
-                    value = urllib.parse.unquote(value)
-
-                if key in query_params:
-                    existing_value = query_params[key]
-                    if isinstance(existing_value, list):
-                        existing_value.append(value)
-                    else:
-                        query_params[key] = [str(existing_value), value]
-                else:
-                    query_params[key] = value
+    query_params = _parse_query(query) if query else {}
 
     # Extract userinfo, host, and port from netloc
     userinfo = None
@@ -218,32 +261,107 @@ def parse_agent_uri(uri: str) -> AgentUri:
     port = None
 
     # Special handling for DID URIs which have multiple colons
-    if parsed.netloc.startswith("did:"):
+    if netloc.startswith("did:"):
         # For DID URIs, keep the entire netloc as the host
-        host = parsed.netloc
+        host = netloc
     else:
         # Normal handling for standard netloc format
-        host = parsed.hostname or ""
-        port = parsed.port
+        host, port = _split_host_port(netloc)
 
-    if "@" in parsed.netloc:
-        userinfo_part, _ = parsed.netloc.split("@", 1)
+    if "@" in netloc:
+        userinfo_part, _ = netloc.split("@", 1)
         userinfo = userinfo_part
 
-    # Create and return AgentUri object
-    return AgentUri(
-        scheme="agent",
-        transport=transport,
-        authority=parsed.netloc,
-        path=parsed.path.lstrip("/"),  # Remove leading slash for consistency
-        query=query_params if query_params else {},
-        fragment=parsed.fragment or None,
-        userinfo=userinfo,
-        host=host,
-        port=port,
+    return (
+        transport,
+        netloc,
+        path.lstrip("/"),  # Remove leading slash for consistency
+        query_params,
+        fragment or None,
+        userinfo,
+        host,
+        port,
     )
 
 
+def _check_brackets(netloc: str) -> None:
+    """
+    Validate IPv6 brackets across the whole authority, as urlsplit does.
+
+    An unmatched '[' or ']' anywhere in the authority raises ValueError, as
+    does a first bracketed part that is not an IPv6 or IPvFuture literal.
+    """
+    if ("[" in netloc) != ("]" in netloc):
+        raise ValueError("Invalid IPv6 URL")
+    if "[" in netloc:
+        bracketed = netloc.partition("[")[2].partition("]")[0]
+        if bracketed.startswith("v"):
+            if not _IPV_FUTURE_RE.match(bracketed):
+                raise ValueError("IPvFuture address is invalid")
+        elif ipaddress.ip_address(bracketed).version == 4:
+            raise ValueError("An IPv4 address cannot be in brackets")
+
+
+def _split_host_port(netloc: str) -> Tuple[str, Optional[int]]:
+    """
+    Split the host and port out of a URI authority with plain string ops.
+
+    Follows urllib's hostname and port rules: userinfo before the last '@'
+    is skipped, IPv6 brackets are removed, the host is lowercased (except
+    for an IPv6 zone id), and an invalid port raises ValueError. Brackets
+    are validated beforehand by _check_brackets on the whole authority.
+    """
+    _, _, hostinfo = netloc.rpartition("@")
+    _, open_bracket, bracketed = hostinfo.partition("[")
+    if open_bracket:
+        host, _, after_host = bracketed.partition("]")
+        _, _, port_str = after_host.partition(":")
+    else:
+        host, _, port_str = hostinfo.partition(":")
+
+    if host:
+        host, percent, zone = host.partition("%")
+        host = host.lower() + percent + zone
+
+    if not port_str:
+        return host, None
+    if not (port_str.isdigit() and port_str.isascii()):
+        raise ValueError(f"Port could not be cast to integer value as {port_str!r}")
+    port = int(port_str)
+    if not 0 <= port <= 65535:
+        raise ValueError("Port out of range 0-65535")
+    return host, port
+
+
+def _parse_query(query: str) -> Dict[str, Union[str, List[str]]]:
+    """
+    Parse a query string in a single pass.
+
+    Unlike parse_qs, '+' is kept as a literal plus rather than decoded to a
+    space, parameters without '=' are skipped, and a key only becomes a list
+    of values once it repeats.
+    """
+    query_params: Dict[str, Union[str, List[str]]] = {}
+    for param in query.split("&"):
+        key, sep, value = param.partition("=")
+        if not sep:
+            continue
+        # Most keys and values have nothing to decode; skip the call for those
+        if "%" in key:
+            key = urllib.parse.unquote(key)
+        if "%" in value:
+            value = urllib.parse.unquote(value)
+
+        existing_value = query_params.get(key)
+        if existing_value is None:
+            query_params[key] = value
+        elif isinstance(existing_value, list):
+            existing_value.append(value)
+        else:
+            query_params[key] = [existing_value, value]
+    return query_params
+
+
 def is_valid_agent_uri(uri: str) -> bool:
     """
     Check if a string is a valid agent:// URI.
@@ -254,8 +372,22 @@ def is_valid_agent_uri(uri: str) -> bool:
     Returns:
         bool: True if the URI is a valid agent URI, False otherwise
     """
+    # Reject other schemes with a prefix check, so they never reach the
+    # regex or take up room in the result cache
+    if not uri.startswith(("agent://", "agent+")):
+        return False
+    return _is_valid_agent_uri(uri)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _is_valid_agent_uri(uri: str) -> bool:
+    """
+    Validate an agent URI, caching the result per URI string.
+
+    Rejections are cached too, and no AgentUri object is built.
+    """
     try:
-        parse_agent_uri(uri)
+        _parse_components(uri)
         return True
     except AgentUriError:
         return False
@@ -9,8 +9,14 @@ HTTP caching mechanisms.
 import logging
 from datetime import timedelta
 
+from requests.adapters import HTTPAdapter
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive connection pool size per host; resolve_many() may fetch from the
+# same host on several threads at once
+POOL_MAXSIZE = 32
+
 # Try importing requests_cache, provide fallback if not available
 try:
     import requests_cache
@@ -65,7 +71,15 @@ class CacheProvider:
             backend: Backend to use ('memory', 'sqlite', etc.)
             expire_after: Default cache expiration in seconds
             **kwargs: Additional arguments passed to requests_cache.install_cache
+
+        The sqlite backend runs in write-ahead-log mode (with
+        synchronous=NORMAL) by default, so a cache write costs one WAL
+        append instead of a full journal sync and readers are not blocked
+        by writers; pass wal=False to opt out.
         """
+        if backend == "sqlite":
+            kwargs.setdefault("wal", True)
+
         self.cache_name = cache_name
         self.backend = backend
         self.expire_after = expire_after
@@ -74,7 +88,7 @@ class CacheProvider:
 
     def _create_cached_session(self) -> requests_cache.CachedSession:
         """Create and return a cached session."""
-        return requests_cache.CachedSession(
+        session = requests_cache.CachedSession(
             cache_name=self.cache_name,
             backend=self.backend,
             expire_after=timedelta(seconds=self.expire_after),
@@ -82,11 +96,21 @@ class CacheProvider:
             **self.kwargs,
         )
 
+        # Reuse persistent connections across descriptor fetches
+        adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def clear(self) -> None:
         """Clear all cache entries."""
         self.session.cache.clear()
         logger.debug("Cache cleared")
 
+    def close(self) -> None:
+        """Close the pooled connections held by the cached session."""
+        self.session.close()
+
     def get_session(self) -> requests_cache.CachedSession:
         """Get the cached session for making requests."""
         return self.session
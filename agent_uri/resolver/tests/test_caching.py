@@ -5,11 +5,15 @@ This module tests the caching functionality of the agent resolver,
 focusing on HTTP caching headers like ETag, Last-Modified, and Cache-Control.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 
+from requests.adapters import HTTPAdapter
 from requests.models import Response
 
+from ..cache import POOL_MAXSIZE, REQUESTS_CACHE_AVAILABLE, CacheProvider
 from ..resolver import AgentResolver
 
 # Sample descriptor JSON for testing
@@ -183,6 +187,32 @@ class TestHttpCaching(unittest.TestCase):
         # Verify the cache was cleared
         mock_cache.clear.assert_called_once()
 
+    def test_session_pools_connections(self):
+        """Test that the cached session keeps a shared connection pool."""
+        cache = CacheProvider()
+        adapter = cache.get_session().get_adapter("https://test.example.com/")
+
+        self.assertIsInstance(adapter, HTTPAdapter)
+        self.assertEqual(adapter._pool_maxsize, POOL_MAXSIZE)
+        self.assertIs(cache.get_session().get_adapter("http://x/"), adapter)
+
+        resolver = AgentResolver(cache_provider=cache)
+        resolver.close()
+        cache.close()
+
+    @unittest.skipUnless(REQUESTS_CACHE_AVAILABLE, "requests_cache not installed")
+    def test_sqlite_cache_uses_wal(self):
+        """Test that the sqlite backend opens its database in WAL mode."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CacheProvider(
+                cache_name=os.path.join(temp_dir, "cache"), backend="sqlite"
+            )
+            with cache.get_session().cache.responses.connection() as connection:
+                mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            self.assertEqual(mode, "wal")
+            cache.close()
+            cache.get_session().cache.close()
+
 
 if __name__ == "__main__":
     unittest.main()
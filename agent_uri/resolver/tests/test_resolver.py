@@ -178,6 +178,33 @@ class TestAgentResolver(unittest.TestCase):
         with self.assertRaises(ResolverNotFoundError):
             self.resolver.resolve(uri)
 
+    def test_resolve_many(self):
+        """Test resolving several URIs, keeping order and per-URI errors."""
+        mock_session = MagicMock()
+        self.resolver.session = mock_session
+
+        def mock_get(url, **kwargs):
+            if url == "https://planner.acme.ai/agent.json":
+                return MockResponse(SAMPLE_DESCRIPTOR)
+            return MockResponse({}, status_code=404)
+
+        mock_session.get.side_effect = mock_get
+
+        results = self.resolver.resolve_many(
+            [
+                "agent://planner.acme.ai/",
+                "agent://nonexistent.example.com/",
+                "agent+wss://realtime.acme.ai/chat",
+            ]
+        )
+
+        self.assertEqual(len(results), 3)
+        descriptor, metadata = results[0]
+        self.assertEqual(descriptor.name, "test-agent")
+        self.assertEqual(metadata["resolution_method"], "domain_root")
+        self.assertIsInstance(results[1], ResolverNotFoundError)
+        self.assertEqual(results[2][1]["resolution_method"], "transport_binding")
+
     def test_caching(self):
         """Test that responses are properly cached."""
         uri = "agent://planner.acme.ai/"
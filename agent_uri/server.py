@@ -7,15 +7,16 @@ that conform to the agent:// protocol.
 
 import abc
 import asyncio
+import hashlib
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Runtime imports
 try:
     from fastapi import FastAPI, HTTPException, Request, WebSocket
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse, StreamingResponse
+    from fastapi.responses import JSONResponse, Response, StreamingResponse
     from fastapi.routing import APIRouter
 
     FASTAPI_AVAILABLE = True
@@ -30,6 +31,7 @@ except ImportError:
     WebSocket = None  # type: ignore
     CORSMiddleware = None  # type: ignore
     JSONResponse = None  # type: ignore
+    Response = None  # type: ignore
     StreamingResponse = None  # type: ignore
 
 
@@ -47,6 +49,34 @@ from .handler import BaseHandler, HTTPHandler, WebSocketHandler
 logger = logging.getLogger(__name__)
 
 
+def _if_none_match(header: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag.
+
+    Follows RFC 9110 section 13.1.2: "*" matches any current representation,
+    the header may list several entity tags, and the comparison is weak, so a
+    W/ prefix is ignored.
+
+    Args:
+        header: The If-None-Match header value, if any
+        etag: The current strong ETag, including its quotes
+
+    Returns:
+        True if the client's copy is current and 304 should be sent
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
 class AgentServer(abc.ABC):
     """
     Abstract base class for agent servers.
@@ -352,6 +382,10 @@ if FASTAPI_AVAILABLE:
                 redoc_url="/redoc" if enable_docs else None,
             )
 
+            # Serialized agent.json body and ETag, with the descriptor dict
+            # they were built from
+            self._agent_json: Optional[Tuple[Dict[str, Any], bytes, str]] = None
+
             # Set up router
             self.router = APIRouter(prefix=prefix)
 
@@ -375,9 +409,13 @@ if FASTAPI_AVAILABLE:
             """Set up FastAPI routes."""
             # Set up agent.json endpoint if enabled
             if self.enable_agent_json:
+                # FastAPI needs a plain Request parameter to inject the request
+                async def agent_json_route(request: Request) -> Response:
+                    return await self._get_agent_json(request)
+
                 self.router.add_api_route(
                     "/agent.json",
-                    self._get_agent_json,
+                    agent_json_route,
                     methods=["GET"],
                     response_model=None,
                     summary="Get agent descriptor",
@@ -388,7 +426,7 @@ if FASTAPI_AVAILABLE:
                 if not self.prefix:
                     self.app.add_api_route(
                         "/.well-known/agent.json",
-                        self._get_agent_json,
+                        agent_json_route,
                         methods=["GET"],
                         response_model=None,
                         summary="Get agent descriptor (A2A compatible)",
@@ -420,15 +458,75 @@ if FASTAPI_AVAILABLE:
                 name="websocket",
             )
 
-        async def _get_agent_json(self) -> JSONResponse:
+        def register_capability(self, path: str, capability: Capability) -> None:
             """
-            Get the agent.json descriptor.
+            Register a capability and drop the cached agent.json body.
+
+            Args:
+                path: The URI path to register the capability at
+                capability: The capability to register
+            """
+            super().register_capability(path, capability)
+            self.invalidate_agent_json()
+
+        def invalidate_agent_json(self) -> None:
+            """
+            Drop the cached agent.json body and ETag.
+
+            register_capability() calls this itself. Call it after changing
+            the descriptor any other way, e.g. editing the dict returned by
+            get_agent_descriptor() in place, or the old body keeps being
+            served under the old ETag.
+            """
+            self._agent_json = None
+
+        def _serialized_agent_json(self) -> Tuple[bytes, str]:
+            """
+            Get the agent.json body and its ETag.
+
+            The encoded body is cached until invalidate_agent_json() is called,
+            which register_capability() does. It is also rebuilt when the
+            descriptor generator hands out a new dict. In-place edits to the
+            descriptor dict are not detected and need an explicit
+            invalidate_agent_json().
 
             Returns:
-                JSON response with the agent descriptor
+                A tuple of (body, etag)
             """
             descriptor = self.get_agent_descriptor()
-            return JSONResponse(content=descriptor, media_type="application/json")
+            if self._agent_json is None or self._agent_json[0] is not descriptor:
+                # Same encoding JSONResponse uses
+                body = json.dumps(
+                    descriptor,
+                    ensure_ascii=False,
+                    allow_nan=False,
+                    indent=None,
+                    separators=(",", ":"),
+                ).encode("utf-8")
+                etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+                self._agent_json = (descriptor, body, etag)
+            return self._agent_json[1], self._agent_json[2]
+
+        async def _get_agent_json(self, request: Optional[Request] = None) -> Response:
+            """
+            Get the agent.json descriptor.
+
+            Args:
+                request: The FastAPI request, checked for If-None-Match
+
+            Returns:
+                JSON response with the agent descriptor, or 304 Not Modified
+                when the client already has the current version
+            """
+            body, etag = self._serialized_agent_json()
+            headers = {"ETag": etag}
+            if request is not None and _if_none_match(
+                request.headers.get("if-none-match"), etag
+            ):
+                return Response(status_code=304, headers=headers)
+            return Response(
+                content=body, media_type="application/json", headers=headers
+            )
 
         async def _handle_http_request(
             self, request: Request, path: str
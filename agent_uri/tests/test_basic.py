@@ -5,6 +5,9 @@ This file contains simple tests to verify that the server package
 is installed correctly and can be imported and used.
 """
 
+import subprocess
+import sys
+
 import pytest
 
 from ..capability import Capability
@@ -17,6 +20,37 @@ def test_import():
     assert agent_uri is not None
 
 
+@pytest.mark.parametrize(
+    "package, submodules",
+    [
+        (
+            "agent_uri",
+            "auth capability client descriptor exceptions handler parser "
+            "resolver server transport",
+        ),
+        (
+            "agent_uri.descriptor",
+            "compatibility generator models parser validator",
+        ),
+        ("agent_uri.common.error", "models transport"),
+    ],
+)
+def test_lazy_exports_resolve_after_bare_import(package, submodules):
+    """Test every export and formerly eager submodule resolves on access."""
+    # Run in a fresh interpreter so no other test has imported them yet, and
+    # check the submodules first, before the exports import them as a side effect
+    script = (
+        "import importlib, types\n"
+        f"package = importlib.import_module({package!r})\n"
+        f"for name in {submodules!r}.split():\n"
+        "    assert name in dir(package), name\n"
+        "    assert isinstance(getattr(package, name), types.ModuleType), name\n"
+        "for name in package.__all__:\n"
+        "    assert getattr(package, name) is not None, name\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
 def test_capability_creation():
     """Test that a capability can be created."""
 
@@ -633,7 +633,7 @@ class TestCapabilityAdvanced:
 
         # Mock the input_model to raise a general exception
         with patch.object(cap, "input_model") as mock_model:
-            mock_model.side_effect = RuntimeError("General error")
+            mock_model.model_validate.side_effect = RuntimeError("General error")
 
             with pytest.raises(InvalidInputError) as exc_info:
                 cap.validate_input({"test": "data"})
@@ -700,6 +700,24 @@ class TestCapabilityAdvanced:
         result = await cap.invoke({"text": "test"}, session_id="main-session")
         assert result["session_id"] == "main-session"
 
+    @pytest.mark.asyncio
+    async def test_signature_inspected_once(self) -> None:
+        """Test that the function signature is not re-inspected per invocation."""
+
+        async def session_func(text: str, session_id: str) -> Dict[str, Any]:
+            return {"text": text, "session_id": session_id}
+
+        cap = Capability(func=session_func, memory_enabled=True)
+        assert cap.accepts_session_id is True
+        assert cap.accepts_context is False
+
+        with patch("agent_uri.capability.inspect.signature") as mock_signature:
+            result = await cap.invoke({"text": "test"}, session_id="s1")
+            await cap.invoke({"text": "again"}, session_id="s1")
+
+        mock_signature.assert_not_called()
+        assert result["session_id"] == "s1"
+
     @pytest.mark.asyncio
     async def test_session_context_without_session_id(self) -> None:
         """Test context handling without session_id parameter in function."""
@@ -366,7 +366,7 @@ class TestCLIErrorHandling:
         # Mock the client to avoid actual network calls
         from unittest.mock import AsyncMock
 
-        with patch("agent_uri.cli.AgentClient") as mock_client_class:
+        with patch("agent_uri.client.AgentClient") as mock_client_class:
             mock_client = Mock()
             # Make invoke an async mock since it's awaited in the CLI
             mock_client.invoke = AsyncMock(return_value={"result": "test response"})
@@ -6,7 +6,7 @@ This module contains comprehensive tests for the agent:// URI parser.
 
 import pytest
 
-from ..parser import AgentUri, AgentUriError, parse_agent_uri
+from ..parser import AgentUri, AgentUriError, is_valid_agent_uri, parse_agent_uri
 
 
 class TestAgentUriError:
@@ -63,6 +63,13 @@ class TestAgentUriDataclass:
         assert uri.host == "example.com"
         assert uri.port == 8080
 
+    def test_agent_uri_uses_slots(self):
+        """Test AgentUri instances carry no per-object __dict__."""
+        uri = AgentUri(host="example.com")
+        assert not hasattr(uri, "__dict__")
+        with pytest.raises(AttributeError):
+            uri.unknown = "value"
+
     def test_agent_uri_post_init_query_none(self):
         """Test AgentUri post_init with None query."""
         uri = AgentUri(query=None)
@@ -303,6 +310,37 @@ class TestParseAgentUri:
         assert "message" in uri.query
         assert "symbols" in uri.query
 
+    def test_parse_agent_uri_query_plus_and_duplicates(self):
+        """Test '+' stays literal, bare keys are skipped and repeats form a list."""
+        uri = parse_agent_uri("agent://example.com?q=hello+world&flag&q=a%2Bb")
+        assert uri.query == {"q": ["hello+world", "a+b"]}
+
+    def test_parse_agent_uri_keeps_path_parameters(self):
+        """Test ';' parameters in the last path segment stay in the path."""
+        uri = parse_agent_uri("agent://example.com/my-agent;v=2?param=value")
+        assert uri.path == "my-agent;v=2"
+        assert uri.query == {"param": "value"}
+
+    def test_parse_repeated_uri_returns_independent_objects(self):
+        """Test repeated parses are cached but never share mutable state."""
+        first = parse_agent_uri("agent://example.com/echo?tag=a&tag=b")
+        first.query["tag"].append("c")
+        first.path = "other"
+
+        second = parse_agent_uri("agent://example.com/echo?tag=a&tag=b")
+        assert second is not first
+        assert second.query == {"tag": ["a", "b"]}
+        assert second.path == "echo"
+
+    def test_parsed_uris_are_mutable_and_unhashable(self):
+        """Test AgentUri stays unhashable; caches key on the string form."""
+        first = parse_agent_uri("agent+https://example.com/echo")
+        second = parse_agent_uri("agent+https://example.com/echo")
+        assert first == second
+        with pytest.raises(TypeError):
+            hash(first)
+        assert {first.to_string(): "echo"}[second.to_string()] == "echo"
+
 
 class TestParseAgentUriErrors:
     """Test error handling in parse_agent_uri function."""
@@ -328,6 +366,27 @@ class TestParseAgentUriErrors:
             parse_agent_uri("agent")  # Missing ://
 
 
+class TestIsValidAgentUri:
+    """Test the is_valid_agent_uri function."""
+
+    @pytest.mark.parametrize(
+        "uri_string, expected",
+        [
+            ("agent://example.com", True),
+            ("agent+wss://example.com:9000/echo?mode=chat#top", True),
+            ("http://example.com", False),
+            ("", False),
+            ("agent:example.com", False),
+            ("agent+custom://example.com", False),
+            ("agent:///planning", False),
+        ],
+    )
+    def test_is_valid_agent_uri(self, uri_string, expected):
+        """Test validation of valid and invalid URIs, cached or not."""
+        assert is_valid_agent_uri(uri_string) is expected
+        assert is_valid_agent_uri(uri_string) is expected
+
+
 class TestParseAgentUriEdgeCases:
     """Test edge cases in URI parsing."""
 
@@ -349,6 +408,59 @@ class TestParseAgentUriEdgeCases:
         assert uri.host == "192.168.1.1"
         assert uri.port == 8080
 
+    def test_parse_agent_uri_ipv6_address(self):
+        """Test parsing agent URI with a bracketed IPv6 address."""
+        uri = parse_agent_uri("agent://user@[FE80::1]:8080/echo")
+        assert uri.host == "fe80::1"
+        assert uri.port == 8080
+        assert uri.userinfo == "user"
+
+    def test_parse_agent_uri_invalid_port(self):
+        """Test a non-numeric or out-of-range port is rejected."""
+        with pytest.raises(ValueError):
+            parse_agent_uri("agent://example.com:http")
+        with pytest.raises(ValueError):
+            parse_agent_uri("agent://example.com:70000")
+
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "agent://[x@host]/",
+            "agent://u]x[@host/p",
+            "agent://did:web:[bad]/x",
+            "agent://[192.168.1.1]/",
+            "agent://[vz.x]/",
+        ],
+    )
+    def test_parse_agent_uri_invalid_brackets(self, uri):
+        """Test bracketed authority parts must be IPv6 or IPvFuture literals."""
+        with pytest.raises(ValueError):
+            parse_agent_uri(uri)
+        with pytest.raises(ValueError):
+            is_valid_agent_uri(uri)
+
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "agent://u[x@host/",
+            "agent://u]x@host/",
+            "agent://host]x[/",
+            "agent://]host[/",
+            "agent://did:web:example.com[/x",
+            "agent://did:web:example.com]/x",
+        ],
+    )
+    def test_parse_agent_uri_unmatched_brackets(self, uri):
+        """Test brackets anywhere in the authority must pair up in order."""
+        with pytest.raises(ValueError):
+            parse_agent_uri(uri)
+
+    def test_parse_agent_uri_did_with_ipv6_brackets(self):
+        """Test a did: authority with a valid IPv6 literal is kept whole."""
+        uri = parse_agent_uri("agent://did:web:[::1]/x")
+        assert uri.host == "did:web:[::1]"
+        assert uri.path == "x"
+
     def test_parse_agent_uri_multiple_slashes_in_path(self):
         """Test parsing agent URI with multiple slashes in path."""
         uri = parse_agent_uri("agent://example.com/path/to/agent")
@@ -405,6 +517,12 @@ class TestParseAgentUriTransportBindings:
         uri = parse_agent_uri("agent+ws://example.com")
         assert uri.transport == "ws"
 
+    def test_parse_agent_uri_transport_is_shared_constant(self):
+        """Test parsed transports reuse one string object per protocol."""
+        first = parse_agent_uri("agent+https://one.example.com")
+        second = parse_agent_uri("agent+https://two.example.com")
+        assert first.transport is second.transport
+
     def test_parse_agent_uri_custom_transport(self):
         """Test parsing agent URI with custom transport."""
         # Custom transport is not in the valid protocols list
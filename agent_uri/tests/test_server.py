@@ -284,6 +284,69 @@ class TestFastAPIAgentServer:
         content = json.loads(response.body)
         assert content["name"] == "test-agent"
 
+    @pytest.mark.asyncio
+    async def test_get_agent_json_etag(self):
+        """Test that agent.json is served with an ETag and honors If-None-Match."""
+        server = FastAPIAgentServer("test-agent", "1.0.0")
+
+        response = await server._get_agent_json()
+        etag = response.headers["etag"]
+        assert json.loads(response.body)["name"] == "test-agent"
+
+        # The encoded body is reused until the descriptor changes
+        assert (await server._get_agent_json()).body is response.body
+
+        request = Mock()
+        request.headers = {"if-none-match": etag}
+        not_modified = await server._get_agent_json(request)
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
+
+        # Registering a capability changes the descriptor and its ETag
+        async def echo_handler(message: str) -> str:
+            return message
+
+        metadata = CapabilityMetadata(name="echo", description="Echo capability")
+        server.register_capability("echo", Capability(echo_handler, metadata))
+        response = await server._get_agent_json(request)
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "header, expected_status",
+        [
+            ("*", 304),
+            ("W/{etag}", 304),
+            ('"stale", {etag}', 304),
+            ('"stale",W/{etag}', 304),
+            ('"stale"', 200),
+            ("", 200),
+        ],
+    )
+    async def test_get_agent_json_if_none_match_forms(self, header, expected_status):
+        """Test If-None-Match wildcards, weak tags and lists per RFC 9110."""
+        server = FastAPIAgentServer("test-agent", "1.0.0")
+        etag = (await server._get_agent_json()).headers["etag"]
+
+        request = Mock()
+        request.headers = {"if-none-match": header.format(etag=etag)}
+        response = await server._get_agent_json(request)
+        assert response.status_code == expected_status
+
+    @pytest.mark.asyncio
+    async def test_get_agent_json_invalidated_after_in_place_edit(self):
+        """Test invalidate_agent_json() picks up in-place descriptor edits."""
+        server = FastAPIAgentServer("test-agent", "1.0.0")
+        etag = (await server._get_agent_json()).headers["etag"]
+
+        server.get_agent_descriptor()["description"] = "Edited in place"
+        server.invalidate_agent_json()
+
+        response = await server._get_agent_json()
+        assert response.headers["etag"] != etag
+        assert json.loads(response.body)["description"] == "Edited in place"
+
     @pytest.mark.asyncio
     async def test_handle_http_request_get(self):
         """Test HTTP GET request handling."""
@@ -10,9 +10,7 @@ from .registry import TransportRegistry, default_registry
 from .transports import HttpsTransport, LocalTransport, WebSocketTransport
 
 # Register transport implementations
-default_registry.register_transport(HttpsTransport)
-default_registry.register_transport(WebSocketTransport)
-default_registry.register_transport(LocalTransport)
+default_registry.register_many([HttpsTransport, WebSocketTransport, LocalTransport])
 
 __all__ = [
     "AgentTransport",
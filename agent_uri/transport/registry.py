@@ -7,7 +7,7 @@ protocol specified in agent+<protocol>:// URIs.
 """
 
 import logging
-from typing import Dict, Set, Type
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Type
 
 from .base import AgentTransport, TransportNotSupportedError
 
@@ -27,6 +27,7 @@ class TransportRegistry:
         """Initialize an empty transport registry."""
         self._transports: Dict[str, Type[AgentTransport]] = {}
         self._instances: Dict[str, AgentTransport] = {}
+        self._supported: Optional[FrozenSet[str]] = None
 
     def register_transport(self, transport_class: Type[AgentTransport]) -> None:
         """
@@ -41,10 +42,36 @@ class TransportRegistry:
 
         if protocol in self._transports:
             logger.warning(f"Overriding existing transport for protocol '{protocol}'")
+            self._drop_instance(protocol)
 
         self._transports[protocol] = transport_class
+        self._supported = None
         logger.debug(f"Registered transport for protocol '{protocol}'")
 
+    def register_many(self, transport_classes: Iterable[Type[AgentTransport]]) -> None:
+        """
+        Register several transport protocol implementations at once.
+
+        The class map is updated in a single step, and cached instances are
+        only dropped for protocols that were already registered.
+
+        Args:
+            transport_classes: The transport classes to register
+        """
+        new_transports: Dict[str, Type[AgentTransport]] = {}
+        for transport_class in transport_classes:
+            new_transports[transport_class().protocol] = transport_class
+
+        for protocol in new_transports.keys() & self._transports.keys():
+            logger.warning(f"Overriding existing transport for protocol '{protocol}'")
+            self._drop_instance(protocol)
+
+        self._transports.update(new_transports)
+        self._supported = None
+        logger.debug(
+            "Registered transports for protocols: %s", ", ".join(new_transports)
+        )
+
     def unregister_transport(self, protocol: str) -> bool:
         """
         Unregister a transport protocol.
@@ -57,12 +84,22 @@ class TransportRegistry:
         """
         if protocol in self._transports:
             del self._transports[protocol]
-            if protocol in self._instances:
-                del self._instances[protocol]
+            self._supported = None
+            self._drop_instance(protocol)
             logger.debug(f"Unregistered transport for protocol '{protocol}'")
             return True
         return False
 
+    def clear_transport_cache(self) -> None:
+        """Drop all cached transport instances; they are recreated on demand."""
+        self._instances.clear()
+
+    def _drop_instance(self, protocol: str) -> None:
+        """Drop the cached instance for a protocol and any fallback sharing it."""
+        self._instances.pop(protocol, None)
+        if protocol == "https":
+            self._instances.pop("agent", None)
+
     def get_transport(self, protocol: str) -> AgentTransport:
         """
         Get a transport instance for a specific protocol.
@@ -86,10 +123,11 @@ class TransportRegistry:
             self._instances[protocol] = transport
             return transport
 
-        # Check for fallback to https transport if available
+        # Check for fallback to https transport if available; share the https
+        # instance so both protocols use the same connection pool
         if protocol == "agent" and "https" in self._transports:
             logger.debug("Using https transport as fallback for agent:// URI")
-            transport = self._transports["https"]()
+            transport = self.get_transport("https")
             self._instances["agent"] = transport
             return transport
 
@@ -106,6 +144,21 @@ class TransportRegistry:
         """
         return set(self._transports.keys())
 
+    @property
+    def supported_protocols(self) -> FrozenSet[str]:
+        """
+        All protocols get_transport can serve, including the 'agent' fallback.
+
+        The set is cached and only rebuilt after the registry changes, so it
+        is cheap to test many protocols against it.
+        """
+        if self._supported is None:
+            protocols = set(self._transports)
+            if "https" in protocols:
+                protocols.add("agent")
+            self._supported = frozenset(protocols)
+        return self._supported
+
     def is_protocol_supported(self, protocol: str) -> bool:
         """
         Check if a specific protocol is supported.
@@ -161,6 +161,18 @@ class TestHttpsTransport:
 
             assert "Connection error" in str(excinfo.value)
 
+    def test_close(self):
+        """Test that close only closes a session the transport created."""
+        transport = HttpsTransport()
+        with patch.object(transport.session, "close") as mock_close:
+            transport.close()
+        mock_close.assert_called_once()
+
+        session = Mock(spec=requests.Session)
+        session.headers = {}
+        HttpsTransport(session=session).close()
+        session.close.assert_not_called()
+
     def test_build_url(self, transport):
         """Test building a URL from endpoint and capability."""
         # Method is private but we want to test it directly
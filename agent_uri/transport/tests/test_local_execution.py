@@ -11,7 +11,7 @@ import time
 
 import pytest
 
-from agent_uri.transport.base import TransportError
+from agent_uri.transport.base import TransportError, TransportTimeoutError
 from agent_uri.transport.transports.local import LocalTransport
 
 
@@ -228,6 +228,57 @@ class TestLocalTransportExecution:
         assert "Async function failed" in str(excinfo.value)
         transport.unregister_agent("test_module")
 
+    def test_invoke_async_handler_directly(self, transport):
+        """Test invoking an async handler without a sync wrapper."""
+
+        async def async_add_handler(capability: str, params: dict) -> int:
+            await asyncio.sleep(0.01)
+            return params["a"] + params["b"]
+
+        transport.register_agent("test_module", async_add_handler)
+        try:
+            assert transport.invoke("test_module", "add", {"a": 1, "b": 2}) == 3
+            loop = transport._loop
+            assert transport.invoke("test_module", "add", {"a": 3, "b": 4}) == 7
+            # The same background loop is reused across invocations
+            assert transport._loop is loop
+        finally:
+            transport.unregister_agent("test_module")
+            transport.close()
+
+        assert transport._loop is None
+        assert loop.is_closed()
+
+    def test_invoke_async_handler_with_exception(self, transport):
+        """Test that async handler exceptions surface as TransportError."""
+
+        async def async_failing_handler(capability: str, params: dict) -> str:
+            raise ValueError("Async handler failed")
+
+        transport.register_agent("test_module", async_failing_handler)
+        try:
+            with pytest.raises(TransportError) as excinfo:
+                transport.invoke("test_module", "fail", {})
+            assert "Async handler failed" in str(excinfo.value)
+        finally:
+            transport.unregister_agent("test_module")
+            transport.close()
+
+    def test_invoke_async_handler_timeout(self, transport):
+        """Test that slow async handlers raise TransportTimeoutError."""
+
+        async def slow_handler(capability: str, params: dict) -> str:
+            await asyncio.sleep(5)
+            return "done"
+
+        transport.register_agent("test_module", slow_handler)
+        try:
+            with pytest.raises(TransportTimeoutError):
+                transport.invoke("test_module", "slow", {}, timeout=0.05)
+        finally:
+            transport.unregister_agent("test_module")
+            transport.close()
+
     def test_stream_generator_function(self, transport):
         """Test streaming from generator function."""
 
@@ -290,6 +341,23 @@ class TestLocalTransportExecution:
         assert results[2]["value"] == 12
         transport.unregister_agent("test_module")
 
+    def test_stream_async_generator_handler_directly(self, transport):
+        """Test streaming from an async generator handler without a wrapper."""
+
+        async def async_counter(capability: str, params: dict):
+            for i in range(params["count"]):
+                await asyncio.sleep(0.001)
+                yield {"value": i}
+
+        transport.register_agent("test_module", async_counter)
+        try:
+            results = list(transport.stream("test_module", "count", {"count": 3}))
+        finally:
+            transport.unregister_agent("test_module")
+            transport.close()
+
+        assert results == [{"value": 0}, {"value": 1}, {"value": 2}]
+
     def test_stream_function_with_exception(self, transport):
         """Test streaming function that raises an exception."""
 
@@ -13,7 +13,11 @@ from unittest.mock import Mock, patch
 import pytest
 
 from ..base import TransportError, TransportTimeoutError
-from ..transports.local import LocalAgentRegistry, LocalTransport
+from ..transports.local import (
+    LocalAgentRegistry,
+    LocalTransport,
+    _resolve_agent_name,
+)
 
 
 class TestLocalAgentRegistry:
@@ -399,6 +403,19 @@ class TestLocalTransport:
             transport._parse_endpoint("local://agent-name/capability") == "agent-name"
         )
 
+    def test_parse_endpoint_is_cached(self):
+        """Test that repeated endpoint parsing hits the resolution cache."""
+        transport = LocalTransport()
+        _resolve_agent_name.cache_clear()
+
+        for _ in range(3):
+            agent_name = transport._parse_endpoint("local://cached-agent/cap")
+            assert agent_name == "cached-agent"
+
+        info = _resolve_agent_name.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
     def test_send_request_structure(self):
         """Test that _send_request builds correct request structure."""
         transport = LocalTransport()
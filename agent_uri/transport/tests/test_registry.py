@@ -44,6 +44,25 @@ class TestTransportRegistry:
         assert isinstance(registry._transports["mock"], type)
         assert registry._transports["mock"] == MockTransport
 
+    def test_register_many(self):
+        """Test registering several transports in one call."""
+        registry = TransportRegistry()
+        registry.register_transport(lambda: MockTransport("https"))
+        old_https = registry.get_transport("https")
+        mock_transport = registry._transports["https"]
+
+        registry.register_many(
+            [
+                MockTransport,
+                lambda: MockTransport("https"),
+                lambda: MockTransport("wss"),
+            ]
+        )
+
+        assert registry.list_supported_protocols() == {"mock", "https", "wss"}
+        assert registry._transports["https"] is not mock_transport
+        assert registry.get_transport("https") is not old_https
+
     def test_unregister_transport(self):
         """Test unregistering a transport."""
         registry = TransportRegistry()
@@ -69,6 +88,21 @@ class TestTransportRegistry:
         transport2 = registry.get_transport("mock")
         assert transport is transport2
 
+    def test_reregister_replaces_cached_instance(self):
+        """Test that re-registering a protocol drops its cached instance."""
+        registry = TransportRegistry()
+        registry.register_transport(lambda: MockTransport("https"))
+        old_https = registry.get_transport("https")
+        assert registry.get_transport("agent") is old_https
+
+        registry.register_transport(lambda: MockTransport("https"))
+        new_https = registry.get_transport("https")
+        assert new_https is not old_https
+        assert registry.get_transport("agent") is new_https
+
+        registry.clear_transport_cache()
+        assert registry.get_transport("https") is not new_https
+
     def test_get_transport_not_found(self):
         """Test getting a non-existent transport."""
         registry = TransportRegistry()
@@ -86,6 +120,9 @@ class TestTransportRegistry:
         transport = registry.get_transport("agent")
         assert transport is https_transport
 
+        # The fallback shares the https instance rather than creating another
+        assert registry.get_transport("https") is transport
+
     def test_is_protocol_supported(self):
         """Test checking if a protocol is supported."""
         registry = TransportRegistry()
@@ -96,6 +133,19 @@ class TestTransportRegistry:
         assert registry.is_protocol_supported("nonexistent") is False
         assert registry.is_protocol_supported("agent") is True  # Due to https fallback
 
+    def test_supported_protocols(self):
+        """Test the cached frozenset of supported protocols."""
+        registry = TransportRegistry()
+        registry.register_transport(MockTransport)
+        assert registry.supported_protocols == frozenset({"mock"})
+        assert registry.supported_protocols is registry.supported_protocols
+
+        registry.register_transport(lambda: MockTransport("https"))
+        assert registry.supported_protocols == {"mock", "https", "agent"}
+
+        registry.unregister_transport("https")
+        assert registry.supported_protocols == {"mock"}
+
     def test_list_supported_protocols(self):
         """Test listing supported protocols."""
         registry = TransportRegistry()
@@ -113,6 +113,28 @@ class TestWebSocketErrorHandling:
         response = transport._active_requests["123"]["response_queue"].get_nowait()
         assert response == {"data": "test"}
 
+    def test_on_message_preserves_stdlib_json_semantics(self, transport):
+        """Test replies with big integers and NaN are decoded like json.loads."""
+        transport._active_requests["123"] = {
+            "capability": "test",
+            "response_queue": Queue(),
+        }
+        transport._active_requests["456"] = {
+            "capability": "test",
+            "response_queue": Queue(),
+        }
+
+        transport._on_message(
+            None, '{"id": "123", "result": 123456789012345678901234567890}'
+        )
+        transport._on_message(None, '{"id": "456", "result": NaN}')
+
+        response = transport._active_requests["123"]["response_queue"].get_nowait()
+        assert response == 123456789012345678901234567890
+        response = transport._active_requests["456"]["response_queue"].get_nowait()
+        assert response != response  # NaN
+        assert transport._message_queue.empty()
+
     def test_on_message_processing_error(self, transport):
         """Test message handler when processing raises an error."""
         with patch("agent_uri.transport.transports.websocket.logger") as mock_logger:
@@ -161,10 +183,11 @@ class TestWebSocketErrorHandling:
             "req1": {"capability": "test1", "response_queue": Queue()},
             "req2": {"capability": "test2", "response_queue": Queue()},
         }
-        transport._request_callbacks = {
+        callbacks = {
             "req3": Mock(),
             "req4": Mock(),
         }
+        transport._request_callbacks = dict(callbacks)
 
         # Add some queued messages
         transport._message_queue.put("msg1")
@@ -179,6 +202,13 @@ class TestWebSocketErrorHandling:
         assert len(transport._request_callbacks) == 0
         assert transport._message_queue.empty()
 
+        # Waiting requests are told the connection closed
+        for callback in callbacks.values():
+            callback.assert_called_once()
+            error = callback.call_args[0][0]
+            assert isinstance(error, TransportError)
+            assert "WebSocket connection closed" in str(error)
+
     @patch("websocket.WebSocketApp")
     def test_stream_with_callback_error(self, mock_ws_class, transport):
         """Test streaming handles errors in message callbacks."""
@@ -42,59 +42,25 @@ class TestWebSocketStreaming:
             sent_messages.append(msg_data)
             request_id = msg_data["id"]
 
-            # Use a thread to simulate async responses with proper timing
-            def simulate_responses():
-                time.sleep(0.01)  # Small delay to ensure stream setup
-
-                # Send streaming chunks
-                transport._on_message(
-                    None,
-                    json.dumps(
-                        {
-                            "id": request_id,
-                            "chunk": {"index": 0, "data": "First chunk"},
-                            "streaming": True,
-                        }
-                    ),
-                )
-
-                time.sleep(0.01)
+            # Deliver the chunks and completion as soon as the request is sent;
+            # they are queued for the stream in arrival order
+            for index, data in enumerate(
+                ["First chunk", "Second chunk", "Third chunk"]
+            ):
                 transport._on_message(
                     None,
                     json.dumps(
                         {
                             "id": request_id,
-                            "chunk": {"index": 1, "data": "Second chunk"},
+                            "chunk": {"index": index, "data": data},
                             "streaming": True,
                         }
                     ),
                 )
 
-                time.sleep(0.01)
-                transport._on_message(
-                    None,
-                    json.dumps(
-                        {
-                            "id": request_id,
-                            "chunk": {"index": 2, "data": "Third chunk"},
-                            "streaming": True,
-                        }
-                    ),
-                )
-
-                time.sleep(0.01)
-                # Signal completion properly
-                transport._on_message(
-                    None,
-                    json.dumps(
-                        {
-                            "id": request_id,
-                            "complete": True,
-                        }
-                    ),
-                )
-
-            threading.Thread(target=simulate_responses, daemon=True).start()
+            transport._on_message(
+                None, json.dumps({"id": request_id, "complete": True})
+            )
 
         mock_ws.send.side_effect = send_and_respond
 
@@ -119,6 +85,36 @@ class TestWebSocketStreaming:
         assert received_chunks[1] == {"index": 1, "data": "Second chunk"}
         assert received_chunks[2] == {"index": 2, "data": "Third chunk"}
 
+    @patch("websocket.WebSocketApp")
+    def test_streaming_burst_before_completion(self, mock_ws_class, transport):
+        """Test that chunks queued ahead of completion are all delivered."""
+        mock_ws = Mock()
+        mock_ws_class.return_value = mock_ws
+        transport._ws = mock_ws
+        transport._is_connected = True
+
+        def send_and_respond(msg):
+            request_id = json.loads(msg)["id"]
+            # Deliver every chunk and the completion before the consumer reads
+            for i in range(200):
+                transport._on_message(
+                    None,
+                    json.dumps(
+                        {"id": request_id, "chunk": {"index": i}, "streaming": True}
+                    ),
+                )
+            transport._on_message(
+                None, json.dumps({"id": request_id, "complete": True})
+            )
+
+        mock_ws.send.side_effect = send_and_respond
+
+        received = list(
+            transport.stream("wss://example.com", "burst-stream", {}, timeout=5)
+        )
+
+        assert [chunk["index"] for chunk in received] == list(range(200))
+
     def test_streaming_with_custom_format(self, transport):
         """Test streaming with custom message format (simplified)."""
         # Mock the stream method to verify parameters and return data
@@ -153,6 +149,97 @@ class TestWebSocketStreaming:
             message_format={"protocol": "custom/1.0", "type": "stream"},
         )
 
+    def test_prepare_stream_matches_unprepared_messages(self, transport):
+        """Test prepared builders produce the same messages as stream()."""
+        json_rpc_builder = transport.prepare_stream("stream")
+        assert json.loads(json_rpc_builder("req-1", "stream", None)) == {
+            "jsonrpc": "2.0",
+            "id": "req-1",
+            "method": "stream",
+            "params": {},
+        }
+
+        custom_builder = transport.prepare_stream(
+            "custom-stream",
+            json_rpc=False,
+            message_format={"protocol": "custom/1.0", "type": "stream"},
+        )
+        assert json.loads(
+            custom_builder("req-2", "custom-stream", {"filter": "active"})
+        ) == {
+            "id": "req-2",
+            "capability": "custom-stream",
+            "stream": True,
+            "protocol": "custom/1.0",
+            "type": "stream",
+            "params": {"filter": "active"},
+        }
+        assert "params" not in json.loads(
+            custom_builder("req-3", "custom-stream", None)
+        )
+
+    @patch("websocket.WebSocketApp")
+    def test_streaming_with_message_builder(self, mock_ws_class, transport):
+        """Test stream() sends messages from a prepared builder."""
+        mock_ws = Mock()
+        mock_ws_class.return_value = mock_ws
+        transport._ws = mock_ws
+        transport._is_connected = True
+
+        sent_messages = []
+
+        def capture_send(msg):
+            msg_data = json.loads(msg)
+            sent_messages.append(msg_data)
+            transport._on_message(
+                None, json.dumps({"id": msg_data["id"], "complete": True})
+            )
+
+        mock_ws.send.side_effect = capture_send
+
+        builder = transport.prepare_stream(
+            "custom-stream", json_rpc=False, message_format={"type": "stream"}
+        )
+        for _ in range(2):
+            list(
+                transport.stream(
+                    "wss://example.com",
+                    "custom-stream",
+                    {"filter": "active"},
+                    message_builder=builder,
+                    close_on_complete=False,
+                )
+            )
+
+        assert [msg["id"] for msg in sent_messages] == ["req-1", "req-2"]
+        assert all(msg["type"] == "stream" for msg in sent_messages)
+        assert all(msg["params"] == {"filter": "active"} for msg in sent_messages)
+
+    @patch("websocket.WebSocketApp")
+    def test_streaming_with_builder_for_other_capability(
+        self, mock_ws_class, transport
+    ):
+        """Test stream() rejects a builder prepared for another capability."""
+        mock_ws = Mock()
+        mock_ws_class.return_value = mock_ws
+        transport._ws = mock_ws
+        transport._is_connected = True
+
+        builder = transport.prepare_stream("custom-stream")
+        with pytest.raises(ValueError, match="custom-stream"):
+            list(
+                transport.stream(
+                    "wss://example.com",
+                    "other-stream",
+                    {},
+                    message_builder=builder,
+                    close_on_complete=False,
+                )
+            )
+
+        mock_ws.send.assert_not_called()
+        assert transport._request_callbacks == {}
+
     @patch("websocket.WebSocketApp")
     def test_streaming_timeout(self, mock_ws_class, transport):
         """Test streaming timeout when no data is received."""
@@ -187,6 +274,28 @@ class TestWebSocketStreaming:
             excinfo.value
         ) or "WebSocket connection closed" in str(excinfo.value)
 
+    @patch("websocket.WebSocketApp")
+    def test_streaming_wakes_on_close(self, mock_ws_class, transport):
+        """Test a waiting stream fails as soon as the connection closes."""
+        mock_ws = Mock()
+        mock_ws_class.return_value = mock_ws
+        transport._ws = mock_ws
+        transport._is_connected = True
+
+        # Close the connection right after the request goes out
+        mock_ws.send.side_effect = lambda msg: transport._on_close(
+            None, 1006, "Abnormal closure"
+        )
+
+        stream_gen = transport.stream("wss://example.com", "stream", {}, timeout=30)
+
+        start = time.monotonic()
+        with pytest.raises(TransportError) as excinfo:
+            list(stream_gen)
+
+        assert "WebSocket connection closed" in str(excinfo.value)
+        assert time.monotonic() - start < 1.0
+
     @patch("websocket.WebSocketApp")
     def test_streaming_error_handling(self, mock_ws_class, transport):
         """Test streaming handles errors gracefully."""
@@ -248,49 +357,28 @@ class TestWebSocketStreaming:
         sent_messages = []
         request_id = None
 
-        def capture_send(msg):
+        def send_and_respond(msg):
             nonlocal request_id
             msg_data = json.loads(msg)
             sent_messages.append(msg_data)
             request_id = msg_data["id"]
 
-        mock_ws.send.side_effect = capture_send
+            # Send first chunk
+            transport._on_message(
+                None,
+                json.dumps(
+                    {"id": request_id, "chunk": {"data": "chunk1"}, "streaming": True}
+                ),
+            )
+
+        mock_ws.send.side_effect = send_and_respond
 
         # Start streaming
         stream_gen = transport.stream(
             "wss://example.com", "fragile-stream", {}, timeout=2
         )
 
-        # Start the generator in background to trigger send and get request_id
-        import threading
-        import time
-
-        first_chunk_result = []
-
-        def start_generator():
-            try:
-                chunk = next(stream_gen)
-                first_chunk_result.append(chunk)
-            except Exception as e:
-                first_chunk_result.append(e)
-
-        gen_thread = threading.Thread(target=start_generator, daemon=True)
-        gen_thread.start()
-        time.sleep(0.05)  # Give time for generator to start and send message
-
-        # Now request_id should be available from the callback
-        # Send first chunk
-        transport._on_message(
-            None,
-            json.dumps(
-                {"id": request_id, "chunk": {"data": "chunk1"}, "streaming": True}
-            ),
-        )
-
-        # Wait for the generator thread to complete and get the result
-        gen_thread.join(timeout=1)
-        assert len(first_chunk_result) > 0
-        assert first_chunk_result[0] == {"data": "chunk1"}
+        assert next(stream_gen) == {"data": "chunk1"}
 
         # Simulate connection loss
         transport._is_connected = False
@@ -319,30 +407,20 @@ class TestWebSocketStreaming:
             sent_messages.append(msg_data)
             request_id = msg_data["id"]
 
-            # Send chunks immediately after stream setup
-            def send_chunks():
-                nonlocal chunks_sent
-                time.sleep(0.01)  # Small delay to ensure callback is registered
-
-                # Send many chunks rapidly but don't complete yet
-                num_chunks = 50
-                for i in range(num_chunks):
-                    transport._on_message(
-                        None,
-                        json.dumps(
-                            {
-                                "id": request_id,
-                                "chunk": {"index": i, "data": f"chunk_{i}"},
-                                "streaming": True,
-                            }
-                        ),
-                    )
-                    chunks_sent += 1
-                    # Add a tiny delay every few chunks to ensure queue processing
-                    if i % 10 == 9:
-                        time.sleep(0.001)
-
-            threading.Thread(target=send_chunks, daemon=True).start()
+            # Send many chunks rapidly but don't complete yet, routing the
+            # already-decoded messages directly
+            nonlocal chunks_sent
+            chunks = [
+                {
+                    "id": request_id,
+                    "chunk": {"index": i, "data": f"chunk_{i}"},
+                    "streaming": True,
+                }
+                for i in range(50)
+            ]
+            for chunk in chunks:
+                transport._on_message_obj(chunk)
+                chunks_sent += 1
 
         mock_ws.send.side_effect = capture_send
 
@@ -355,9 +433,7 @@ class TestWebSocketStreaming:
             received.append(chunk["index"])
             if len(received) >= 11:  # Only check first 11
                 # Send complete message after we've consumed what we need
-                transport._on_message(
-                    None, json.dumps({"id": request_id, "complete": True})
-                )
+                transport._on_message_obj({"id": request_id, "complete": True})
                 break
 
         # Verify chunks were received in order
@@ -384,13 +460,9 @@ class TestWebSocketStreaming:
             request_id = msg_data["id"]
 
             # Send complete message after stream setup
-            def send_complete():
-                time.sleep(0.01)  # Small delay to ensure callback is registered
-                transport._on_message(
-                    None, json.dumps({"id": request_id, "complete": True})
-                )
-
-            threading.Thread(target=send_complete, daemon=True).start()
+            transport._on_message(
+                None, json.dumps({"id": request_id, "complete": True})
+            )
 
         mock_ws.send.side_effect = capture_send
 
@@ -438,22 +510,13 @@ class TestWebSocketStreaming:
         sent_messages = []
         request_id = None
 
-        def capture_send(msg):
+        def send_chunks(msg):
             nonlocal request_id
             msg_data = json.loads(msg)
             sent_messages.append(msg_data)
             request_id = msg_data["id"]
 
-        mock_ws.send.side_effect = capture_send
-
-        # Start streaming
-        stream_gen = transport.stream(
-            "wss://example.com", "sparse-stream", {}, timeout=5
-        )
-
-        # Send mix of empty and non-empty chunks in thread
-        def send_chunks():
-            time.sleep(0.01)  # Let stream_gen initialize
+            # Send mix of empty and non-empty chunks
             chunks = [
                 {"id": request_id, "chunk": {"data": "chunk1"}, "streaming": True},
                 {"id": request_id, "chunk": {}, "streaming": True},  # Empty chunk
@@ -467,15 +530,14 @@ class TestWebSocketStreaming:
             ]
 
             for chunk in chunks:
-                time.sleep(0.01)
                 transport._on_message(None, json.dumps(chunk))
 
-        chunk_thread = threading.Thread(target=send_chunks)
-        chunk_thread.start()
+        mock_ws.send.side_effect = send_chunks
 
         # Collect all chunks
-        received = list(stream_gen)
-        chunk_thread.join()
+        received = list(
+            transport.stream("wss://example.com", "sparse-stream", {}, timeout=5)
+        )
 
         # Should receive all chunks including empty ones
         assert len(received) == 4
@@ -52,6 +52,7 @@ class HttpsTransport(AgentTransport):
             verify_ssl: Whether to verify SSL certificates
             user_agent: User-Agent header to include in requests
         """
+        self._owns_session = session is None
         self._session = session or requests.Session()
         self._verify_ssl = verify_ssl
         self._user_agent = user_agent
@@ -71,6 +72,15 @@ class HttpsTransport(AgentTransport):
         """Get the requests session being used."""
         return self._session
 
+    def close(self) -> None:
+        """
+        Close the pooled connections of the session this transport created.
+
+        A session passed in by the caller is left open for the caller to close.
+        """
+        if self._owns_session:
+            self._session.close()
+
     def invoke(
         self,
         endpoint: str,
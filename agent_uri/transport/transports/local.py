@@ -6,6 +6,10 @@ enabling communication with agents running in the local environment
 through inter-process communication.
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import inspect
 import json
 import logging
 import os
@@ -15,12 +19,56 @@ import tempfile
 import threading
 import time
 import uuid
-from typing import Any, Callable, Dict, Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 from ..base import AgentTransport, TransportError, TransportTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Scheme prefixes accepted in local endpoint strings
+_ENDPOINT_PREFIXES = ("local://", "agent+local://", "agent://")
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_agent_name(endpoint: str) -> str:
+    """
+    Resolve an endpoint string to a local agent name.
+
+    Endpoints are resolved on every invocation, so results are cached
+    per endpoint string.
+
+    Args:
+        endpoint: The endpoint string
+
+    Returns:
+        Agent name
+    """
+    agent_name = endpoint
+
+    # Remove protocol prefix if present
+    for prefix in _ENDPOINT_PREFIXES:
+        if endpoint.startswith(prefix):
+            agent_name = endpoint[len(prefix) :]
+            break
+
+    # Remove path components and query parameters if present
+    return agent_name.split("/", 1)[0].split("?", 1)[0]
+
+
+@functools.lru_cache(maxsize=256)
+def _split_tcp_address(socket_path: str) -> Tuple[str, int]:
+    """
+    Split a ``host:port`` socket path into a TCP address tuple.
+
+    Args:
+        socket_path: Socket path of the form ``127.0.0.1:<port>``
+
+    Returns:
+        Tuple of (host, port)
+    """
+    host, port = socket_path.split(":")
+    return host, int(port)
+
 
 class LocalAgentRegistry:
     """
@@ -214,10 +262,9 @@ class LocalAgentRegistry:
         # Create and configure socket
         if socket_path.startswith("127.0.0.1"):
             # TCP socket (Windows or explicit TCP)
-            host, port = socket_path.split(":")
             server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            server_socket.bind((host, int(port)))
+            server_socket.bind(_split_tcp_address(socket_path))
         else:
             # Unix domain socket (Unix-based systems)
             if os.path.exists(socket_path):
@@ -395,6 +442,11 @@ class LocalTransport(AgentTransport):
         """Initialize a local transport adapter."""
         self._registry = LocalAgentRegistry.get_instance()
 
+        # Background event loop for async handlers, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
         # Start the registry server if not already running
         if not getattr(self._registry, "_running", False):
             self._registry.start()
@@ -404,6 +456,22 @@ class LocalTransport(AgentTransport):
         """Return the transport protocol identifier."""
         return "local"
 
+    def close(self) -> None:
+        """Stop the background event loop used for async handlers."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+
+        if loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(1.0)
+        if not loop.is_running():
+            loop.close()
+
     def invoke(
         self,
         endpoint: str,
@@ -443,12 +511,20 @@ class LocalTransport(AgentTransport):
             # Direct invocation
             try:
                 result = local_handler(capability, params or {})
+                # Await coroutines from async handlers on the background loop
+                if inspect.iscoroutine(result):
+                    result = self._run_coroutine(result, timeout)
+                # Collect async generators into a list
+                if inspect.isasyncgen(result):
+                    return list(self._iterate_async(result, timeout))
                 # Check if result is a generator and convert to list
                 # for JSON serialization
                 if hasattr(result, "__iter__") and hasattr(result, "__next__"):
                     # It's a generator, convert to list
                     return list(result)
                 return result
+            except TransportTimeoutError:
+                raise
             except Exception as e:
                 raise TransportError(f"Error invoking local agent: {str(e)}")
 
@@ -512,9 +588,16 @@ class LocalTransport(AgentTransport):
         if local_handler:
             # Direct streaming invocation
             try:
-                for item in local_handler(capability, params or {}):
+                result = local_handler(capability, params or {})
+                if inspect.iscoroutine(result):
+                    result = self._run_coroutine(result, timeout)
+                if inspect.isasyncgen(result):
+                    result = self._iterate_async(result, timeout)
+                for item in result:
                     yield self.parse_response(item)
                 return
+            except TransportTimeoutError:
+                raise
             except Exception as e:
                 raise TransportError(f"Error streaming from local agent: {str(e)}")
 
@@ -578,36 +661,79 @@ class LocalTransport(AgentTransport):
         """
         return self._registry.list_agents()
 
-    def _parse_endpoint(self, endpoint: str) -> str:
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
         """
-        Parse an endpoint to extract the agent name.
+        Get the background event loop, starting it on first use.
+
+        Async handlers are run on a single long-lived loop in a daemon thread
+        rather than creating and tearing down a loop per invocation.
+
+        Returns:
+            The running background event loop
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="local-transport-loop", daemon=True
+                )
+                thread.start()
+                self._loop = loop
+                self._loop_thread = thread
+            return self._loop
+
+    def _run_coroutine(self, coro: Any, timeout: Optional[float]) -> Any:
+        """
+        Run a coroutine on the background loop and wait for its result.
 
         Args:
-            endpoint: The endpoint string
+            coro: Coroutine to run
+            timeout: Timeout in seconds
 
         Returns:
-            Agent name
+            The coroutine's result
+
+        Raises:
+            TransportTimeoutError: If the coroutine does not finish in time
         """
-        # Remove protocol prefix if present
-        if endpoint.startswith(("local://", "agent+local://", "agent://")):
-            if endpoint.startswith("local://"):
-                agent_name = endpoint[len("local://") :]
-            elif endpoint.startswith("agent+local://"):
-                agent_name = endpoint[len("agent+local://") :]
-            else:  # agent://
-                agent_name = endpoint[len("agent://") :]
-        else:
-            agent_name = endpoint
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TransportTimeoutError(
+                f"Local agent did not respond within {timeout} seconds"
+            )
 
-        # Remove path components if present
-        if "/" in agent_name:
-            agent_name = agent_name.split("/", 1)[0]
+    def _iterate_async(self, agen: Any, timeout: Optional[float]) -> Iterator[Any]:
+        """
+        Iterate an async generator from synchronous code.
 
-        # Remove query parameters if present
-        if "?" in agent_name:
-            agent_name = agent_name.split("?", 1)[0]
+        Args:
+            agen: Async generator to drive on the background loop
+            timeout: Timeout in seconds for each item
 
-        return agent_name
+        Returns:
+            Iterator yielding the generator's items
+        """
+        while True:
+            try:
+                yield self._run_coroutine(agen.__anext__(), timeout)
+            except StopAsyncIteration:
+                return
+
+    @staticmethod
+    def _parse_endpoint(endpoint: str) -> str:
+        """
+        Parse an endpoint to extract the agent name.
+
+        Args:
+            endpoint: The endpoint string
+
+        Returns:
+            Agent name
+        """
+        return _resolve_agent_name(endpoint)
 
     def _send_request(
         self,
@@ -648,9 +774,8 @@ class LocalTransport(AgentTransport):
         try:
             if socket_path.startswith("127.0.0.1"):
                 # TCP socket
-                host, port = socket_path.split(":")
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.connect((host, int(port)))
+                sock.connect(_split_tcp_address(socket_path))
             else:
                 # Unix domain socket
                 sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
@@ -731,9 +856,8 @@ class LocalTransport(AgentTransport):
         try:
             if socket_path.startswith("127.0.0.1"):
                 # TCP socket
-                host, port = socket_path.split(":")
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.connect((host, int(port)))
+                sock.connect(_split_tcp_address(socket_path))
             else:
                 # Unix domain socket
                 sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
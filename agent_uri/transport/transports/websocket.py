@@ -31,6 +31,12 @@ MAX_JSON_DEPTH = 64  # Maximum JSON nesting depth
 MAX_JSON_OBJECTS = 10000  # Maximum JSON objects/arrays
 MAX_QUEUE_SIZE = 1000  # Maximum message queue size
 
+# Maximum number of already-queued stream messages handled per wakeup
+STREAM_BATCH_SIZE = 128
+
+# Queued by a stream callback once the server signals completion
+_STREAM_COMPLETE = object()
+
 
 class WebSocketTransport(AgentTransport):
     """
@@ -195,28 +201,22 @@ class WebSocketTransport(AgentTransport):
             self._ws.send(message_str)
         except Exception as e:
             # Clean up on error
-            if request_id in self._request_callbacks:
-                del self._request_callbacks[request_id]
-            if request_id in self._active_requests:
-                del self._active_requests[request_id]
+            self._request_callbacks.pop(request_id, None)
+            self._active_requests.pop(request_id, None)
             raise TransportError(f"Error sending WebSocket message: {str(e)}")
 
         # Wait for response with timeout
         if not response_event.wait(timeout):
             # Clean up on timeout
-            if request_id in self._request_callbacks:
-                del self._request_callbacks[request_id]
-            if request_id in self._active_requests:
-                del self._active_requests[request_id]
+            self._request_callbacks.pop(request_id, None)
+            self._active_requests.pop(request_id, None)
             raise TransportTimeoutError(
                 f"WebSocket request timed out after {timeout} seconds"
             )
 
         # Clean up after response
-        if request_id in self._request_callbacks:
-            del self._request_callbacks[request_id]
-        if request_id in self._active_requests:
-            del self._active_requests[request_id]
+        self._request_callbacks.pop(request_id, None)
+        self._active_requests.pop(request_id, None)
 
         # Check for errors
         if isinstance(response[0], Exception):
@@ -249,6 +249,9 @@ class WebSocketTransport(AgentTransport):
                 - json_rpc: Whether to use JSON-RPC format (default: True)
                 - close_on_complete: Whether to close connection when done
                 - message_format: Format for non-JSON-RPC messages
+                - message_builder: Message builder from prepare_stream()
+                  for the same capability, used instead of json_rpc and
+                  message_format
 
         Returns:
             An iterator that yields response messages
@@ -256,6 +259,7 @@ class WebSocketTransport(AgentTransport):
         Raises:
             TransportError: If there is an error communicating with the agent
             TransportTimeoutError: If the connection times out
+            ValueError: If message_builder was prepared for another capability
         """
         if timeout is None:
             timeout = 60  # Default connection timeout
@@ -266,46 +270,54 @@ class WebSocketTransport(AgentTransport):
         # Check if connection should be closed when streaming completes
         close_on_complete = kwargs.get("close_on_complete", True)
 
-        # Connect if not already connected
-        if not self._is_connected:
-            self._connect(url, headers)
-
         # Prepare request message
         request_id = self._get_next_request_id()
 
-        # Determine message format
-        json_rpc = kwargs.get("json_rpc", True)
-
-        message: Dict[str, Any]
-        if json_rpc:
-            # JSON-RPC format
-            message = {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "method": capability,
-                "params": params or {},
-            }
+        message_builder = kwargs.get("message_builder")
+        if message_builder is not None:
+            # Fixed fields were serialized up front by prepare_stream()
+            message_str = message_builder(request_id, capability, params)
         else:
-            # Custom message format
-            message_format = kwargs.get("message_format", {})
-            message = {
-                "id": request_id,
-                "capability": capability,
-                "stream": True,
-            }
-            if message_format:
-                message.update(message_format)
-            if params:
-                message["params"] = params
+            # Determine message format
+            json_rpc = kwargs.get("json_rpc", True)
+
+            message: Dict[str, Any]
+            if json_rpc:
+                # JSON-RPC format
+                message = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": capability,
+                    "params": params or {},
+                }
+            else:
+                # Custom message format
+                message_format = kwargs.get("message_format", {})
+                message = {
+                    "id": request_id,
+                    "capability": capability,
+                    "stream": True,
+                }
+                if message_format:
+                    message.update(message_format)
+                if params:
+                    message["params"] = params
+
+            message_str = json.dumps(message)
+
+        # Connect if not already connected
+        if not self._is_connected:
+            self._connect(url, headers)
 
         # Set up message queue for this request
-        message_queue: Queue[Dict[str, Any]] = Queue()
+        message_queue: Queue[Any] = Queue()
         streaming_complete = threading.Event()
 
         def on_stream_message(msg):
             try:
                 if isinstance(msg, dict) and msg.get("type") == "complete":
-                    streaming_complete.set()
+                    # Queue completion behind any chunks still waiting to be read
+                    message_queue.put(_STREAM_COMPLETE)
                 elif isinstance(msg, Exception):
                     # Handle error by putting it in queue, but don't mark complete yet
                     # The stream loop will process the error and then complete
@@ -320,15 +332,13 @@ class WebSocketTransport(AgentTransport):
         self._request_callbacks[request_id] = on_stream_message
 
         # Send message
-        message_str = json.dumps(message)
         try:
             if self._ws is None:
                 raise TransportError("WebSocket connection not established")
             self._ws.send(message_str)
         except Exception as e:
             # Clean up on send error
-            if request_id in self._request_callbacks:
-                del self._request_callbacks[request_id]
+            self._request_callbacks.pop(request_id, None)
             raise TransportError(f"Error sending WebSocket message: {str(e)}")
 
         # Yield messages as they arrive
@@ -355,28 +365,96 @@ class WebSocketTransport(AgentTransport):
 
                 try:
                     msg = message_queue.get(timeout=remaining_timeout)
-                    if isinstance(msg, Exception):
-                        # Error received - mark stream as complete and raise
-                        streaming_complete.set()
-                        raise TransportError(f"WebSocket error: {str(msg)}")
-                    yield self.parse_response(msg)
                 except Empty:
                     # No message received within timeout
                     if self._ws and self._is_connected:
                         continue  # Still connected, keep waiting
                     else:
                         raise TransportError("WebSocket connection closed")
+
+                # Drain anything else already queued so a burst of chunks
+                # is handled in one pass instead of one wakeup per chunk
+                batch = [msg]
+                while len(batch) < STREAM_BATCH_SIZE:
+                    try:
+                        batch.append(message_queue.get_nowait())
+                    except Empty:
+                        break
+
+                try:
+                    for msg in batch:
+                        if msg is _STREAM_COMPLETE:
+                            return
+                        if isinstance(msg, Exception):
+                            # Error received - mark stream as complete and raise
+                            streaming_complete.set()
+                            raise TransportError(f"WebSocket error: {str(msg)}")
+                        yield self.parse_response(msg)
                 except Exception as e:
                     if isinstance(e, TransportError):
                         raise
                     raise TransportError(f"Error processing stream: {str(e)}")
         finally:
             # Clean up - use safe deletion in case callback was already removed
-            if request_id in self._request_callbacks:
-                del self._request_callbacks[request_id]
+            self._request_callbacks.pop(request_id, None)
             if close_on_complete and self._is_connected:
                 self._disconnect()
 
+    def prepare_stream(
+        self,
+        capability: str,
+        *,
+        json_rpc: bool = True,
+        message_format: Optional[Dict[str, Any]] = None,
+    ) -> Callable[[str, str, Optional[Dict[str, Any]]], str]:
+        """
+        Prepare a request message builder for repeated streams.
+
+        The fields that are identical for every request are serialized once,
+        so only the request id and parameters are encoded per stream. Pass
+        the result to stream() as ``message_builder``.
+
+        Args:
+            capability: The capability the messages are addressed to
+            json_rpc: Whether to use JSON-RPC format
+            message_format: Extra fields for non-JSON-RPC messages; "id"
+                and "params" are always filled in per request
+
+        Returns:
+            A callable taking (request_id, capability, params) and returning
+            the serialized request message. It raises ValueError when given
+            a capability other than the one it was prepared for.
+        """
+        fields: Dict[str, Any]
+        if json_rpc:
+            fields = {"jsonrpc": "2.0", "method": capability}
+        else:
+            fields = {"capability": capability, "stream": True}
+            if message_format:
+                fields.update(message_format)
+            fields.pop("id", None)
+            fields.pop("params", None)
+
+        # Serialized fixed fields without the surrounding braces
+        fixed = json.dumps(fields)[1:-1]
+
+        def build(
+            request_id: str, stream_capability: str, params: Optional[Dict[str, Any]]
+        ) -> str:
+            if stream_capability != capability:
+                raise ValueError(
+                    f"Message builder was prepared for capability {capability!r}, "
+                    f"not {stream_capability!r}"
+                )
+            parts = ['{"id": ', json.dumps(request_id), ", ", fixed]
+            if json_rpc or params:
+                parts.append(', "params": ')
+                parts.append(json.dumps(params or {}))
+            parts.append("}")
+            return "".join(parts)
+
+        return build
+
     def _connect(self, url: str, headers: Optional[Dict[str, str]] = None) -> None:
         """
         Establish a WebSocket connection with retry logic.
@@ -631,28 +709,50 @@ class WebSocketTransport(AgentTransport):
 
             # First try to parse as JSON
             try:
-                parsed_data = json.loads(message)
-                # Security: Validate the parsed JSON structure
-                self._validate_json_structure(parsed_data)
-                data = parsed_data
+                data = json.loads(message)
             except json.JSONDecodeError:
                 # Not valid JSON - queue as-is for backward compatibility
                 self._message_queue.put(message)
                 return
-            except TransportError:
-                # Security validation failed - reraise to be caught below
-                raise
 
+            # Security: Validate the parsed JSON structure
+            self._validate_json_structure(data)
+
+        except TransportError as e:
+            # Security validation failed - log error and queue the error
+            logger.error(f"Security validation failed for WebSocket message: {str(e)}")
+            self._message_queue.put(e)
+            return
+        except Exception as e:
+            logger.error(f"Error processing WebSocket message: {str(e)}")
+            self._message_queue.put(e)
+            return
+
+        self._on_message_obj(data)
+
+    def _on_message_obj(self, data: Any) -> None:
+        """
+        Route an already parsed and validated WebSocket message.
+
+        Messages that are already decoded can be delivered here directly,
+        skipping the JSON parsing done by _on_message.
+
+        Args:
+            data: Decoded JSON message
+        """
+        try:
             # Check if this is a response to a specific request
-            if isinstance(data, dict) and "id" in data:
-                request_id = data.get("id")
+            if isinstance(data, dict) and isinstance(data.get("id"), str):
+                request_id: str = data["id"]
 
                 # Check for active requests first (used by invoke)
-                if request_id in self._active_requests:
-                    request_info = self._active_requests[request_id]
+                request_info = self._active_requests.get(request_id)
+                if request_info is not None:
                     response_queue = request_info.get("response_queue")
 
                     if response_queue:
+                        callback = self._request_callbacks.get(request_id)
+
                         # Handle JSON-RPC error response
                         if "error" in data:
                             error_info = data.get("error", {})
@@ -665,16 +765,16 @@ class WebSocketTransport(AgentTransport):
                             )
                             response_queue.put(error)
                             # Also trigger callback if exists to unblock waiting threads
-                            if request_id in self._request_callbacks:
-                                self._request_callbacks[request_id](error)
+                            if callback is not None:
+                                callback(error)
                             return
 
                         # Handle JSON-RPC result
                         if "result" in data:
                             response_queue.put(data["result"])
                             # Also trigger callback if exists to unblock waiting threads
-                            if request_id in self._request_callbacks:
-                                self._request_callbacks[request_id](data["result"])
+                            if callback is not None:
+                                callback(data["result"])
                             return
 
                         # Handle streaming complete
@@ -682,16 +782,13 @@ class WebSocketTransport(AgentTransport):
                             # Mark stream as complete
                             response_queue.put({"type": "complete"})
                             # Clean up active request and callback
-                            if request_id in self._active_requests:
-                                del self._active_requests[request_id]
-                            if request_id in self._request_callbacks:
-                                del self._request_callbacks[request_id]
+                            self._active_requests.pop(request_id, None)
+                            self._request_callbacks.pop(request_id, None)
                             return
 
                 # Check for request callbacks (used by stream)
-                if request_id in self._request_callbacks:
-                    callback = self._request_callbacks[request_id]
-
+                callback = self._request_callbacks.get(request_id)
+                if callback is not None:
                     # Handle JSON-RPC error response
                     if "error" in data:
                         error_info = data.get("error", {})
@@ -702,7 +799,7 @@ class WebSocketTransport(AgentTransport):
                         error = TransportError(f"{sanitized_msg} (code: {error_code})")
                         callback(error)  # type: ignore[arg-type]
                         # Remove callback for non-streaming responses
-                        del self._request_callbacks[request_id]
+                        self._request_callbacks.pop(request_id, None)
                         return
 
                     # Handle streaming chunk
@@ -716,29 +813,25 @@ class WebSocketTransport(AgentTransport):
                         # Signal completion to the stream
                         callback({"type": "complete"})
                         # Remove callback when streaming is complete
-                        del self._request_callbacks[request_id]
+                        self._request_callbacks.pop(request_id, None)
                         return
 
                     # Handle JSON-RPC result
                     if "result" in data:
                         callback(data["result"])
                         # Remove callback for non-streaming responses
-                        del self._request_callbacks[request_id]
+                        self._request_callbacks.pop(request_id, None)
                         return
 
                     # Handle simple response with just id
                     callback(data)
                     # Remove callback for non-streaming responses
-                    del self._request_callbacks[request_id]
+                    self._request_callbacks.pop(request_id, None)
                     return
 
             # Put in the general message queue if no specific handler
             self._message_queue.put(data)
 
-        except TransportError as e:
-            # Security validation failed - log error and queue the error
-            logger.error(f"Security validation failed for WebSocket message: {str(e)}")
-            self._message_queue.put(e)
         except Exception as e:
             logger.error(f"Error processing WebSocket message: {str(e)}")
             self._message_queue.put(e)
@@ -774,9 +867,19 @@ class WebSocketTransport(AgentTransport):
         )
 
         # Clear all pending requests and callbacks
+        callbacks = list(self._request_callbacks.values())
         self._active_requests.clear()
         self._request_callbacks.clear()
 
+        # Wake any invoke or stream still waiting on this connection so it
+        # fails now instead of waiting out its timeout
+        error = TransportError("WebSocket connection closed")
+        for callback in callbacks:
+            try:
+                callback(error)
+            except Exception as e:
+                logger.debug(f"Error notifying request of closed connection: {e}")
+
         # Clear message queues
         self._clear_queue(self._message_queue)
         self._clear_queue(self._response_queue)
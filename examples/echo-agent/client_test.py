@@ -11,6 +11,7 @@ import datetime
 import json
 import logging
 
+from echo_common import ROUNDS, benchmark_echo_capability, json_dumps
 from http_transport import HttpTransport
 
 # Configure logging
@@ -19,13 +20,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared by every call so repeated invocations reuse the same connections
+_TRANSPORT = HttpTransport()
+
 
 async def test_echo_capability():
     """Demonstrate invoking the Echo Agent's echo capability using agent:// protocol."""
     print("\n=== Echo Agent Test ===\n")
 
-    # Create a transport
-    transport = HttpTransport()
+    transport = _TRANSPORT
 
     try:
         # Create test data
@@ -41,10 +44,10 @@ async def test_echo_capability():
         custom_headers = {"X-Session-ID": "test-session-123"}
 
         # Invoke the capability using the agent:// protocol
-        response = await transport.invoke(
+        response = await transport.invoke_bytes(
             endpoint=agent_uri,
             capability=capability,
-            params={"message": message},
+            body=json_dumps({"message": message}),
             headers=custom_headers,
         )
 
@@ -80,6 +83,15 @@ async def main():
     try:
         # Run the test
         await test_echo_capability()
+
+        # Then show the benefit of reusing the transport's connections
+        if ROUNDS > 0:
+            await benchmark_echo_capability(
+                _TRANSPORT,
+                "agent+http://localhost:8765",
+                {"X-Session-ID": "test-session-123"},
+                ROUNDS,
+            )
     except KeyboardInterrupt:
         logger.info("Test interrupted by user")
     except Exception as e:
@@ -11,6 +11,7 @@ import datetime
 import json
 import logging
 
+from echo_common import ROUNDS, benchmark_echo_capability, json_dumps
 from http_transport import HttpTransport
 
 # Configure logging
@@ -19,13 +20,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared by every call so repeated invocations reuse the same connections
+_TRANSPORT = HttpTransport()
+
 
 async def test_echo_capability():
     """Demonstrate invoking the Echo Agent's echo capability using agent:// protocol."""
     print("\n=== Echo Agent Direct Test ===\n")
 
-    # Create a transport
-    transport = HttpTransport()
+    transport = _TRANSPORT
 
     try:
         # Create a test message with the current time
@@ -39,10 +42,10 @@ async def test_echo_capability():
         print("Checking if echo agent server is running...")
         try:
             # Use the agent+http:// explicit transport binding
-            response = await transport.invoke(
+            response = await transport.invoke_bytes(
                 endpoint="agent+http://localhost:8765",
                 capability="echo",
-                params={"message": message},
+                body=json_dumps({"message": message}),
                 headers={"X-Session-ID": "direct-client-test-session"},
             )
         except Exception as e:
@@ -83,6 +86,17 @@ def main():
     """Run the direct Echo Agent client test."""
     try:
         asyncio.run(test_echo_capability())
+
+        # Then show the benefit of reusing the transport's connections
+        if ROUNDS > 0:
+            asyncio.run(
+                benchmark_echo_capability(
+                    _TRANSPORT,
+                    "agent+http://localhost:8765",
+                    {"X-Session-ID": "direct-client-test-session"},
+                    ROUNDS,
+                )
+            )
     except KeyboardInterrupt:
         logger.info("Test interrupted by user")
     except Exception as e:
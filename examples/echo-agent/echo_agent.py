@@ -6,22 +6,27 @@ This agent demonstrates basic capability invocation with an 'echo' capability
 that responds with the same message sent to it, appended with a timestamp.
 """
 
-import datetime
 import json
 import logging
 import os
+import sys
 from typing import Any, Dict
 
-import uvicorn
+from echo_common import now_iso
 
-# Import from the installed agent_uri package
+# Import from the installed agent_uri package. The server stack (FastAPI,
+# uvicorn) is imported where it is used, so importing this module just for
+# the echo capability stays cheap.
 from agent_uri.capability import capability
-from agent_uri.server import FastAPIAgentServer
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Set PROD=1 to drop the CORS middleware and interactive docs routes
+PRODUCTION = os.environ.get("PROD") == "1"
+
+
 # Define echo capability using the decorator
 
 
@@ -78,21 +83,25 @@ async def echo(
     if not isinstance(message, str):
         message = str(message) if message is not None else ""
 
-    # Log the session info if available
+    # Log the session info if available; %-style arguments are only
+    # formatted when a handler actually emits the record
     if session_id:
-        logger.info(f"Request from session: {session_id}")
-
-    # Add verbose logging to help with debugging
-    logger.info(
-        f"Echo capability called with params: {params}, session_id: {session_id}"
-    )
-    if kwargs:
-        logger.info(f"Additional kwargs: {list(kwargs.keys())}")
-
-    current_time = datetime.datetime.now().isoformat()
+        logger.info("Request from session: %s", session_id)
+
+    # Verbose call details are only logged when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Echo capability called with params: %s, session_id: %s",
+            params,
+            session_id,
+        )
+        if kwargs:
+            logger.debug("Additional kwargs: %s", list(kwargs.keys()))
+
+    current_time = now_iso()
     result = f"{message} [{current_time}]"
 
-    logger.info(f"Echo capability called with message: {message}")
+    logger.info("Echo capability called with message: %s", message)
 
     return {"result": result, "timestamp": current_time, "original_message": message}
 
@@ -108,6 +117,8 @@ def create_echo_agent_server(host: str = "0.0.0.0", port: int = 8765):
     Returns:
         Configured FastAPIAgentServer instance
     """
+    from agent_uri.server import FastAPIAgentServer
+
     # Create the server
     server = FastAPIAgentServer(
         name="echo-agent",
@@ -117,45 +128,70 @@ def create_echo_agent_server(host: str = "0.0.0.0", port: int = 8765):
         documentation_url="https://github.com/username/agent-uri/examples/echo-agent",
         interaction_model="request-response",
         server_url=f"http://{host}:{port}",
-        enable_cors=True,
-        enable_docs=True,
+        enable_cors=not PRODUCTION,
+        enable_docs=not PRODUCTION,
         enable_agent_json=True,
     )
 
     # Register the echo capability
     server.register_capability("echo", echo._capability)
 
-    # Ensure output directory exists
-    os.makedirs("./output", exist_ok=True)
+    return server
 
-    # Save the agent descriptor
-    server.save_agent_descriptor("./output/agent.json")
 
-    return server
+def create_app():
+    """
+    Create the Echo Agent ASGI app for uvicorn worker processes.
+
+    Returns:
+        The FastAPI application of a configured Echo Agent server
+    """
+    host = os.environ.get("HOST", "0.0.0.0")
+    port = int(os.environ.get("PORT", "8765"))
+    return create_echo_agent_server(host, port).app
 
 
 def main():
     """Run the Echo Agent server."""
+    import uvicorn
+
     # Configure host and port
     host = os.environ.get("HOST", "0.0.0.0")
     port = int(
         os.environ.get("PORT", "8765")
     )  # Changed default port to avoid conflicts
+    workers = int(os.environ.get("WORKERS", "1"))
 
     # Create the server
     server = create_echo_agent_server(host, port)
 
+    # Save the agent descriptor once here rather than in every worker
+    os.makedirs("./output", exist_ok=True)
+    server.save_agent_descriptor("./output/agent.json")
+
     # Print out the agent descriptor
     descriptor = server.get_agent_descriptor()
     print("\nEcho Agent Descriptor:")
-    print(json.dumps(descriptor, indent=2))
+    json.dump(descriptor, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
     # Run the server
     print(f"\nStarting Echo Agent server on http://{host}:{port}")
-    print(f"- API docs: http://{host}:{port}/docs")
+    if not PRODUCTION:
+        print(f"- API docs: http://{host}:{port}/docs")
     print(f"- Agent descriptor: http://{host}:{port}/agent.json")
 
-    uvicorn.run(server.app, host=host, port=port)
+    if workers > 1:
+        # Each worker builds its own server through the create_app factory
+        uvicorn.run(
+            "echo_agent:create_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+        )
+    else:
+        uvicorn.run(server.app, host=host, port=port)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""
+Helpers shared by the echo agent example scripts.
+
+Every script here imports this module by name, so run them from this
+directory (or with it on sys.path) as the README shows.
+"""
+
+import asyncio
+import datetime
+import json
+import os
+import time
+from typing import Any, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Encode and decode JSON with orjson when it is installed; its decode errors
+# subclass json.JSONDecodeError, so callers can keep catching that
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        """Serialize obj to UTF-8 JSON bytes, like orjson.dumps."""
+        return json.dumps(obj).encode("utf-8")
+
+
+# (epoch seconds, ISO string) of the most recently formatted timestamp
+_last_timestamp = (0.0, "")
+
+
+def now_iso() -> str:
+    """Return the current time in ISO format, reformatting at most once per ms."""
+    global _last_timestamp
+    now = time.time()
+    if now - _last_timestamp[0] >= 0.001:
+        _last_timestamp = (now, datetime.datetime.fromtimestamp(now).isoformat())
+    return _last_timestamp[1]
+
+
+# Number of concurrent invocations issued by the benchmarks (0 disables them)
+ROUNDS = int(os.environ.get("ROUNDS", "100"))
+
+
+def pooled_session(pool_maxsize: int = 20) -> requests.Session:
+    """Return a session whose pools keep up to pool_maxsize connections alive."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_maxsize=pool_maxsize))
+    session.mount("https://", HTTPAdapter(pool_maxsize=pool_maxsize))
+    return session
+
+
+async def benchmark_echo_capability(
+    transport: Any, endpoint: str, headers: Dict[str, str], rounds: int
+) -> None:
+    """Issue several echo invocations at once over one shared transport."""
+    print(f"\n=== Echo Agent Benchmark ({rounds} invocations) ===\n")
+
+    calls = [
+        transport.invoke_bytes(
+            endpoint=endpoint,
+            capability="echo",
+            body=json_dumps({"message": f"Benchmark message {i}"}),
+            headers=headers,
+        )
+        for i in range(rounds)
+    ]
+
+    start = time.perf_counter()
+    try:
+        responses = await asyncio.gather(*calls)
+    except Exception as e:
+        print(f"Error: {e}")
+        print("❌ Benchmark failed: Could not connect to Echo Agent")
+        return
+    elapsed = time.perf_counter() - start
+
+    print(f"Completed {len(responses)} invocations in {elapsed:.3f}s")
+    print(f"Average latency: {elapsed / len(responses) * 1000:.2f}ms")
@@ -6,24 +6,32 @@ the agent-server SDK.
 This is a simplified version that avoids the session_id parameter handling issues.
 """
 
-import datetime
+import hashlib
 import json
 import logging
 import os
+from typing import Any, Dict
 
 import uvicorn
+from echo_common import json_dumps, json_loads, now_iso
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Set PROD=1 to drop the interactive docs routes and per-request access logs
+PRODUCTION = os.environ.get("PROD") == "1"
+
 # Create FastAPI app
 app = FastAPI(
     title="Echo Agent",
     description="An example agent that echoes messages with timestamps",
     version="1.0.0",
+    docs_url=None if PRODUCTION else "/docs",
+    redoc_url=None if PRODUCTION else "/redoc",
+    openapi_url=None if PRODUCTION else "/openapi.json",
 )
 
 # Descriptor for the agent
@@ -68,18 +76,33 @@ AGENT_DESCRIPTOR = {
     ],
 }
 
-# Create the output directory
-os.makedirs("./output", exist_ok=True)
 
-# Save the agent descriptor
-with open("./output/agent.json", "w") as f:
-    json.dump(AGENT_DESCRIPTOR, f, indent=2)
+# The descriptor never changes at runtime, so serialize it once up front
+AGENT_DESCRIPTOR_JSON = json.dumps(AGENT_DESCRIPTOR).encode("utf-8")
+AGENT_DESCRIPTOR_ETAG = (
+    f'"{hashlib.blake2b(AGENT_DESCRIPTOR_JSON, digest_size=8).hexdigest()}"'
+)
 
 
 @app.get("/agent.json")
-async def get_agent_json():
+async def get_agent_json(request: Request):
     """Return the agent descriptor."""
-    return JSONResponse(content=AGENT_DESCRIPTOR)
+    headers = {"ETag": AGENT_DESCRIPTOR_ETAG, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("If-None-Match") == AGENT_DESCRIPTOR_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=AGENT_DESCRIPTOR_JSON, media_type="application/json", headers=headers
+    )
+
+
+def _echo_result(message: Any) -> Dict[str, Any]:
+    """Build the echo response for a message."""
+    current_time = now_iso()
+    return {
+        "result": f"{message} [{current_time}]",
+        "timestamp": current_time,
+        "original_message": message,
+    }
 
 
 @app.post("/echo")
@@ -94,31 +117,26 @@ async def echo_capability(request: Request):
         The echoed message with timestamp
     """
     try:
-        # Get request body
-        body = await request.json()
+        # Get request body, decoding the raw bytes directly
+        body = json_loads(await request.body())
 
         # Extract the message
         message = body.get("message", "")
         if not message:
             raise HTTPException(status_code=400, detail="Missing 'message' parameter")
 
-        # Log incoming request
+        # Log incoming request; %-style arguments are only formatted when
+        # a handler actually emits the record
         session_id = request.headers.get("X-Session-ID")
         if session_id:
-            logger.info(f"Request from session: {session_id}")
+            logger.info("Request from session: %s", session_id)
 
-        logger.info(f"Echo capability called with message: {message}")
+        logger.info("Echo capability called with message: %s", message)
 
-        # Generate response
-        current_time = datetime.datetime.now().isoformat()
-        result = f"{message} [{current_time}]"
-
-        # Return the response
-        return {
-            "result": result,
-            "timestamp": current_time,
-            "original_message": message,
-        }
+        # Serialize the response ourselves so FastAPI skips jsonable_encoder
+        # and its own JSON encoding of the returned dict
+        payload = json_dumps(_echo_result(message))
+        return Response(content=payload, media_type="application/json")
 
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON body")
@@ -127,22 +145,89 @@ async def echo_capability(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/_batch")
+async def batch_capabilities(request: Request):
+    """
+    Invoke several capabilities in a single request.
+
+    Args:
+        request: The FastAPI request, whose body is a JSON array of
+            {"capability": ..., "params": {...}} objects
+
+    Returns:
+        The capability results, in the same order as the calls
+
+    A call to an unknown capability fails the batch with 422 rather than 404,
+    so clients can tell it apart from an agent without a batch endpoint.
+    """
+    try:
+        calls = json_loads(await request.body())
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(calls, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of calls")
+
+    results = []
+    for index, call in enumerate(calls):
+        if not isinstance(call, dict) or call.get("capability") != "echo":
+            raise HTTPException(
+                status_code=422, detail=f"Unknown capability in call {index}"
+            )
+        message = (call.get("params") or {}).get("message", "")
+        if not message:
+            raise HTTPException(status_code=400, detail="Missing 'message' parameter")
+        results.append(_echo_result(message))
+
+    logger.info("Batch of %d echo calls handled", len(results))
+    return Response(content=json_dumps(results), media_type="application/json")
+
+
+def _ensure_descriptor_file(path: str, content: str) -> None:
+    """Write the descriptor file unless it already holds the same content."""
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                return
+    except OSError:
+        pass
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
 def main():
     """Run the standalone Echo server."""
     # Configure host and port
     host = os.environ.get("HOST", "0.0.0.0")
     port = int(os.environ.get("PORT", "8765"))
+    workers = int(os.environ.get("WORKERS", "1"))
+
+    # Save the agent descriptor once here rather than at import time,
+    # which would repeat it in every worker process
+    descriptor_text = json.dumps(AGENT_DESCRIPTOR, indent=2)
+    _ensure_descriptor_file("./output/agent.json", descriptor_text)
 
     # Print server info
     print("\nEcho Agent Descriptor:")
-    print(json.dumps(AGENT_DESCRIPTOR, indent=2))
+    print(descriptor_text)
 
     print(f"\nStarting Echo Agent server on http://{host}:{port}")
-    print(f"- API docs: http://{host}:{port}/docs")
+    if not PRODUCTION:
+        print(f"- API docs: http://{host}:{port}/docs")
     print(f"- Agent descriptor: http://{host}:{port}/agent.json")
 
-    # Start the server
-    uvicorn.run(app, host=host, port=port)
+    # uvicorn picks the uvloop event loop and httptools parser automatically
+    # when they are installed (pip install "uvicorn[standard]")
+    options = {"host": host, "port": port, "access_log": not PRODUCTION}
+
+    # Start the server; the echo endpoint is stateless, so it can be served
+    # by several worker processes sharing the listening socket
+    if workers > 1:
+        # Workers import the app themselves, so it must be passed by name
+        uvicorn.run("echo_standalone:app", workers=workers, **options)
+    else:
+        uvicorn.run(app, **options)
 
 
 if __name__ == "__main__":
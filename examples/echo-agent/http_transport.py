@@ -1,23 +1,143 @@
 """HTTP Transport implementation for agent:// protocol communication."""
 
+import asyncio
+import functools
 import logging
-import re
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import requests
+from echo_common import json_dumps, json_loads
+from requests.adapters import HTTPAdapter
 
 # Import from the installed agent_uri package
+from agent_uri.exceptions import InvocationError
 from agent_uri.transport.base import AgentTransport
 
 logger = logging.getLogger(__name__)
 
+# Headers sent with every request; shared, so never mutate this dict
+_DEFAULT_JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+
+
+class AgentHTTPError(InvocationError, requests.exceptions.HTTPError):
+    """
+    Raised when an agent answers an invocation with an HTTP error status.
+
+    It is also a requests HTTPError, so handlers written for
+    raise_for_status() keep catching it and can read ``response``.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        body: str,
+        url: str,
+        response: Optional[requests.Response] = None,
+    ):
+        super().__init__(f"HTTP {status_code} error: {body}", agent_uri=url)
+        self.status_code = status_code
+        self.response = response
+        self.request = response.request if response is not None else None
+
+
+def _parse_agent_uri(uri: str) -> Tuple[str, str, str]:
+    """
+    Parse an agent URI into transport, authority, and path components.
+
+    Args:
+        uri: The agent URI (e.g., agent://localhost:8765/echo or
+             agent+http://localhost:8765/echo)
+
+    Returns:
+        Tuple containing: (transport, authority, path)
+    """
+    # Split "agent[+protocol]://authority[/path]" with plain string scans,
+    # checking the common explicit http/https bindings first
+    if uri.startswith("agent+http://"):
+        protocol = "http"
+        rest = uri[13:]
+    elif uri.startswith("agent+https://"):
+        protocol = "https"
+        rest = uri[14:]
+    elif uri.startswith("agent://"):
+        protocol = "https"  # Default to HTTPS if not specified
+        rest = uri[8:]
+    elif uri.startswith("agent+"):
+        separator = uri.find("://", 6)
+        protocol = uri[6:separator] if separator > 0 else ""
+        # The transport name must be lowercase ASCII letters
+        if not (protocol.isascii() and protocol.isalpha() and protocol.islower()):
+            return ("http", uri, "")
+        rest = uri[separator + 3 :]
+    else:
+        # If not an agent URI, assume it's a direct HTTP URL
+        return ("http", uri, "")
+
+    slash = rest.find("/")
+    if slash < 0:
+        authority, path = rest, ""
+    else:
+        authority, path = rest[:slash], rest[slash:]
+
+    if not authority:
+        return ("http", uri, "")
+
+    return (protocol, authority, path)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve(uri: str, capability: Optional[str]) -> str:
+    """
+    Resolve an agent URI and capability to an HTTP endpoint.
+
+    Clients usually invoke a handful of agents many times, so the resolved
+    endpoints are memoized; URIs and capability names are plain strings, so
+    the cache key is cheap to hash.
+
+    Args:
+        uri: The agent URI (e.g., agent://localhost:8765 or
+            agent+http://localhost:8765)
+        capability: Optional capability to append to the path
+
+    Returns:
+        HTTP endpoint URL
+    """
+    transport, authority, path = _parse_agent_uri(uri)
+
+    # Append capability if provided and not already in path
+    capability_path = ""
+    if capability:
+        capability_path = "/" + capability
+        if path.endswith(capability_path):
+            capability_path = ""
+
+    # Construct HTTP URL
+    return f"{transport}://{authority}{path}{capability_path}"
+
 
 class HttpTransport(AgentTransport):
-    """HTTP Transport implementation for agent:// protocol."""
+    """
+    HTTP Transport implementation for agent:// protocol.
+
+    Requests are sent through a pooled session owned by the transport, so
+    instances should be reused: invocations after the first skip the TCP and
+    TLS handshakes. Call close() when the transport is no longer needed.
+    """
 
     def __init__(self):
         super().__init__()
         self._protocol = "agent+http"
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=100, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the pooled connections held by this transport."""
+        self._session.close()
 
     @property
     def protocol(self) -> str:
@@ -25,52 +145,60 @@ class HttpTransport(AgentTransport):
         return self._protocol
 
     def _parse_agent_uri(self, uri: str) -> Tuple[str, str, str]:
-        """
-        Parse an agent URI into transport, authority, and path components.
-
-        Args:
-            uri: The agent URI (e.g., agent://localhost:8765/echo or
-                 agent+http://localhost:8765/echo)
+        """Parse an agent URI into transport, authority, and path components."""
+        return _parse_agent_uri(uri)
 
-        Returns:
-            Tuple containing: (transport, authority, path)
-        """
-        # Match agent URI patterns
-        agent_uri_pattern = r"^(agent)(\+([a-z]+))?://([^/]+)(/.*)?$"
-        match = re.match(agent_uri_pattern, uri)
+    def _resolve_agent_uri(self, uri: str, capability: Optional[str] = None) -> str:
+        """Resolve an agent URI to an HTTP endpoint."""
+        return _resolve(uri, capability)
 
-        if not match:
-            # If not an agent URI, assume it's a direct HTTP URL
-            return ("http", uri, "")
+    def _endpoint_url(self, endpoint: str, capability: Optional[str] = None) -> str:
+        """Return the HTTP URL for an agent URI or a direct HTTP endpoint."""
+        # Handle both agent:// URIs and direct HTTP URLs
+        if endpoint.startswith("agent"):
+            return self._resolve_agent_uri(endpoint, capability)
 
-        protocol = match.group(3) or "https"  # Default to HTTPS if not specified
-        authority = match.group(4)
-        path = match.group(5) or ""
+        # Legacy support for direct HTTP endpoints
+        return f"{endpoint}/{capability}" if capability else endpoint
 
-        return (protocol, authority, path)
+    @staticmethod
+    def _request_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Combine the default JSON headers with user-provided headers."""
+        if headers:
+            return {**_DEFAULT_JSON_HEADERS, **headers}
+        # requests copies headers into each request, so sharing is safe
+        return _DEFAULT_JSON_HEADERS
 
-    def _resolve_agent_uri(self, uri: str, capability: Optional[str] = None) -> str:
+    def _post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        timeout: Optional[int],
+        **body: Any,
+    ) -> Dict[str, Any]:
         """
-        Resolve an agent URI to an HTTP endpoint.
-
-        Args:
-            uri: The agent URI (e.g., agent://localhost:8765 or
-                agent+http://localhost:8765)
-            capability: Optional capability to append to the path
+        Send a blocking POST through the pooled session and decode the reply.
 
-        Returns:
-            HTTP endpoint URL
+        The async invoke methods run this in a worker thread, so concurrent
+        invocations overlap their network waits instead of blocking the
+        event loop one after another.
         """
-        transport, authority, path = self._parse_agent_uri(uri)
-
-        # Construct HTTP URL
-        endpoint = f"{transport}://{authority}{path}"
-
-        # Append capability if provided and not already in path
-        if capability and not path.endswith(f"/{capability}"):
-            endpoint = f"{endpoint}/{capability}"
-
-        return endpoint
+        response = self._session.post(url=url, headers=headers, timeout=timeout, **body)
+        # A plain status check keeps the success path free of HTTPError setup
+        if response.status_code >= 400:
+            raise AgentHTTPError(
+                response.status_code, response.text[:200], url, response
+            )
+        try:
+            return json_loads(response.content)
+        except ValueError as e:
+            # Match response.json(), whose decode errors are RequestExceptions
+            raise requests.exceptions.JSONDecodeError(
+                getattr(e, "msg", str(e)),
+                getattr(e, "doc", response.text),
+                getattr(e, "pos", 0),
+                response=response,
+            ) from e
 
     async def stream(
         self,
@@ -80,25 +208,50 @@ class HttpTransport(AgentTransport):
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = 30,
         **kwargs,
-    ) -> Any:
-        """Stream responses from an agent capability via this transport.
+    ) -> AsyncIterator[Any]:
+        """Stream newline-delimited JSON responses from an agent capability.
+
+        The response body is read incrementally and each line is decoded as
+        it arrives, so large results are never materialized in one piece.
 
         Args:
-            endpoint: The base URL of the agent server
+            endpoint: The agent URI (e.g., agent://localhost:8765)
             capability: The capability name to invoke
             params: The parameters to pass to the capability
             headers: Optional HTTP headers
             timeout: Optional timeout in seconds
 
         Returns:
-            An iterator that yields response parts
-
-        Raises:
-            NotImplementedError: This method is not implemented for basic HTTP
+            An async iterator that yields decoded response parts
         """
-        raise NotImplementedError(
-            "Streaming is not implemented for basic HTTP transport"
+        url = self._endpoint_url(endpoint, capability)
+        request_headers = self._request_headers(headers)
+
+        logger.info("Streaming from %s", url)
+        response = await asyncio.to_thread(
+            self._session.post,
+            url=url,
+            data=json_dumps(params or {}),
+            headers=request_headers,
+            timeout=timeout,
+            stream=True,
         )
+        try:
+            if response.status_code >= 400:
+                raise AgentHTTPError(
+                    response.status_code, response.text[:200], url, response
+                )
+
+            # Reading the body blocks, so each read happens in a worker thread
+            lines = response.iter_lines(chunk_size=8192)
+            while True:
+                line = await asyncio.to_thread(next, lines, None)
+                if line is None:
+                    break
+                if line:
+                    yield json_loads(line)
+        finally:
+            response.close()
 
     async def invoke(
         self,
@@ -125,29 +278,107 @@ class HttpTransport(AgentTransport):
         if params is None:
             params = {}
 
-        # Handle both agent:// URIs and direct HTTP URLs
-        if endpoint.startswith("agent"):
-            url = self._resolve_agent_uri(endpoint, capability)
-        else:
-            # Legacy support for direct HTTP endpoints
-            url = f"{endpoint}/{capability}" if capability else endpoint
-
-        # Combine default headers with user-provided headers
-        request_headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        if headers:
-            request_headers.update(headers)
+        url = self._endpoint_url(endpoint, capability)
+        request_headers = self._request_headers(headers)
+
+        try:
+            # Log only the parameter names; values may be large
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Invoking %s with params: %s", url, list(params))
+            return await asyncio.to_thread(
+                self._post, url, request_headers, timeout, data=json_dumps(params)
+            )
+
+        except requests.exceptions.RequestException as e:
+            logger.error("HTTP request failed: %s", e)
+            raise
+
+    async def invoke_bytes(
+        self,
+        endpoint: str,
+        capability: Optional[str],
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = 30,
+    ) -> Dict[str, Any]:
+        """Invoke a capability with a request body that is already JSON-encoded.
+
+        The body is sent as-is, so callers that encode their parameters
+        themselves (or send the same payload repeatedly) skip re-serialization.
+
+        Args:
+            endpoint: The agent URI (e.g., agent://localhost:8765)
+            capability: The capability name to invoke (e.g., echo)
+            body: The JSON-encoded parameters
+            headers: Optional HTTP headers
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The JSON response from the agent
+        """
+        url = self._endpoint_url(endpoint, capability)
+        request_headers = self._request_headers(headers)
 
         try:
-            logger.info(f"Invoking {url} with params: {params}")
-            response = requests.post(
-                url=url, json=params, headers=request_headers, timeout=timeout
+            logger.info("Invoking %s with a %d byte body", url, len(body))
+            return await asyncio.to_thread(
+                self._post, url, request_headers, timeout, data=body
             )
-            response.raise_for_status()
-            return response.json()
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"HTTP request failed: {e}")
+            logger.error("HTTP request failed: %s", e)
             raise
+
+    async def invoke_batch(
+        self,
+        endpoint: str,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = 30,
+    ) -> List[Any]:
+        """Invoke several capabilities on one agent in a single round trip.
+
+        The calls are posted together to the agent's ``/_batch`` endpoint.
+        Agents without one answer 404, in which case the calls are made as
+        concurrent individual invocations instead. Any other error status,
+        such as 422 for an unknown capability in the batch, is raised.
+
+        Args:
+            endpoint: The agent URI (e.g., agent://localhost:8765)
+            calls: (capability, params) pairs to invoke
+            headers: Optional HTTP headers
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The capability results, in the same order as ``calls``
+        """
+        url = f"{self._endpoint_url(endpoint).rstrip('/')}/_batch"
+        request_headers = self._request_headers(headers)
+        payload = [{"capability": c, "params": p} for c, p in calls]
+
+        try:
+            logger.info("Invoking %d capabilities via %s", len(calls), url)
+            return await asyncio.to_thread(
+                self._post, url, request_headers, timeout, data=json_dumps(payload)
+            )
+
+        except AgentHTTPError as e:
+            if e.status_code != 404:
+                logger.error("HTTP request failed: %s", e)
+                raise
+
+        except requests.exceptions.RequestException as e:
+            logger.error("HTTP request failed: %s", e)
+            raise
+
+        # The agent has no batch endpoint, so invoke each capability instead
+        return list(
+            await asyncio.gather(
+                *(
+                    self.invoke(
+                        endpoint, capability, params, headers=headers, timeout=timeout
+                    )
+                    for capability, params in calls
+                )
+            )
+        )
@@ -6,13 +6,12 @@ This client demonstrates how to use the agent:// protocol directly
 without using the transport layer or SDK abstractions.
 """
 
-import asyncio
 import datetime
 import json
 import logging
-import re
 
 import requests
+from echo_common import json_dumps, json_loads, pooled_session
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +22,9 @@ logger = logging.getLogger(__name__)
 # Configure agent URI endpoint with explicit http transport
 AGENT_URI = "agent+http://localhost:8765"
 
+# Shared session so repeated requests reuse the same connection
+SESSION = pooled_session()
+
 
 def resolve_agent_uri(uri, capability=None):
     """
@@ -35,30 +37,49 @@ def resolve_agent_uri(uri, capability=None):
     Returns:
         HTTP endpoint URL
     """
-    # Match agent URI patterns
-    agent_uri_pattern = r"^(agent)(\+([a-z]+))?://([^/]+)(/.*)?$"
-    match = re.match(agent_uri_pattern, uri)
-
-    if not match:
+    # Split "agent[+protocol]://authority[/path]" with plain string scans,
+    # checking the common explicit http/https bindings first
+    if uri.startswith("agent+http://"):
+        protocol = "http"
+        rest = uri[13:]
+    elif uri.startswith("agent+https://"):
+        protocol = "https"
+        rest = uri[14:]
+    elif uri.startswith("agent://"):
+        protocol = "http"  # Default to HTTP if not specified
+        rest = uri[8:]
+    elif uri.startswith("agent+"):
+        separator = uri.find("://", 6)
+        protocol = uri[6:separator] if separator > 0 else ""
+        # The transport name must be lowercase ASCII letters
+        if not (protocol.isascii() and protocol.isalpha() and protocol.islower()):
+            return uri
+        rest = uri[separator + 3 :]
+    else:
         # If not an agent URI, return as is (assume it's a direct HTTP URL)
         return uri
 
-    # Extract components
-    protocol = match.group(3) or "http"  # Default to HTTP if not specified
-    authority = match.group(4)
-    path = match.group(5) or ""
+    slash = rest.find("/")
+    if slash < 0:
+        authority, path = rest, ""
+    else:
+        authority, path = rest[:slash], rest[slash:]
 
-    # Construct HTTP URL
-    endpoint = f"{protocol}://{authority}{path}"
+    if not authority:
+        return uri
 
     # Append capability if provided and not already in path
-    if capability and not path.endswith(f"/{capability}"):
-        endpoint = f"{endpoint}/{capability}"
+    capability_path = ""
+    if capability:
+        capability_path = "/" + capability
+        if path.endswith(capability_path):
+            capability_path = ""
 
-    return endpoint
+    # Construct HTTP URL
+    return f"{protocol}://{authority}{path}{capability_path}"
 
 
-async def test_echo_capability():
+def test_echo_capability():
     """Test the echo capability using the agent:// protocol."""
     print("\n=== Simple Echo Agent Test ===\n")
 
@@ -77,9 +98,9 @@ async def test_echo_capability():
         # Send request with error handling
         try:
             # Do not include any session ID at all to avoid the duplication issue
-            response = requests.post(
+            response = SESSION.post(
                 url=agent_endpoint,
-                json={"message": message},
+                data=json_dumps({"message": message}),
                 headers={
                     "Content-Type": "application/json",
                     "Accept": "application/json",
@@ -91,7 +112,7 @@ async def test_echo_capability():
             response.raise_for_status()
 
             # Parse response
-            data = response.json()
+            data = json_loads(response.content)
             print(f"\nResponse status: {response.status_code}")
             print(f"Response body: {json.dumps(data, indent=2)}\n")
 
@@ -112,7 +133,7 @@ async def test_echo_capability():
                 print("❌ Test failed: No result")
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
+            logger.error("Request failed: %s", e)
             if hasattr(e, "response") and e.response is not None:
                 print(f"Status code: {e.response.status_code}")
                 try:
@@ -128,16 +149,16 @@ async def test_echo_capability():
             print("4. The echo capability might need troubleshooting")
 
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
 
 
-async def main():
+def main():
     """Run the Echo Agent test."""
-    await test_echo_capability()
+    test_echo_capability()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        main()
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
@@ -9,6 +9,10 @@ import datetime
 import json
 
 import requests
+from echo_common import json_dumps, json_loads, pooled_session
+
+# Shared session so repeated requests reuse the same connection
+SESSION = pooled_session()
 
 
 def test_echo_server():
@@ -27,9 +31,9 @@ def test_echo_server():
         print(f"Message: {message}")
 
         # Send the request
-        response = requests.post(
+        response = SESSION.post(
             url=url,
-            json={"message": message},
+            data=json_dumps({"message": message}),
             headers={"Content-Type": "application/json", "Accept": "application/json"},
         )
 
@@ -37,7 +41,7 @@ def test_echo_server():
         response.raise_for_status()
 
         # Parse response
-        data = response.json()
+        data = json_loads(response.content)
         print(f"\nResponse status: {response.status_code}")
         print(f"Response body: {json.dumps(data, indent=2)}\n")
 
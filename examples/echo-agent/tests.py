@@ -11,18 +11,31 @@ import datetime
 import unittest
 from unittest import mock
 
+import requests
+
 # Import our echo agent modules
 from echo_agent import create_echo_agent_server, echo
-from http_transport import HttpTransport
+from echo_standalone import app as standalone_app
+from fastapi.testclient import TestClient
+from http_transport import AgentHTTPError, HttpTransport
 
 # Import from the installed agent_uri package
 from agent_uri.client import AgentClient
 from agent_uri.transport.registry import default_registry
 
+# Timestamp returned by the pinned clock in EchoCapabilityTest
+FIXED_TIMESTAMP = "2024-01-01T12:00:00"
+
 
 class EchoCapabilityTest(unittest.TestCase):
     """Test the echo capability directly."""
 
+    def setUp(self):
+        """Pin the echo clock so results can be compared exactly."""
+        patcher = mock.patch("echo_agent.now_iso", return_value=FIXED_TIMESTAMP)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_echo_response_structure(self):
         """Test that the echo function returns the expected structure."""
         # Run the echo function using asyncio
@@ -44,8 +57,8 @@ class EchoCapabilityTest(unittest.TestCase):
             self.fail("timestamp is not a valid ISO format datetime string")
 
         # Verify result format
-        self.assertTrue(result["result"].startswith(message))
-        self.assertIn(result["timestamp"], result["result"])
+        self.assertEqual(result["timestamp"], FIXED_TIMESTAMP)
+        self.assertEqual(result["result"], f"{message} [{FIXED_TIMESTAMP}]")
 
     def test_echo_with_empty_message(self):
         """Test echo function with an empty message."""
@@ -53,7 +66,7 @@ class EchoCapabilityTest(unittest.TestCase):
         result = asyncio.run(echo(params={"message": message}))
 
         self.assertEqual(result["original_message"], message)
-        self.assertTrue(result["result"].startswith(message))
+        self.assertEqual(result["result"], f" [{FIXED_TIMESTAMP}]")
 
     def test_echo_with_special_characters(self):
         """Test echo function with special characters."""
@@ -61,7 +74,7 @@ class EchoCapabilityTest(unittest.TestCase):
         result = asyncio.run(echo(params={"message": message}))
 
         self.assertEqual(result["original_message"], message)
-        self.assertTrue(result["result"].startswith(message))
+        self.assertEqual(result["result"], f"{message} [{FIXED_TIMESTAMP}]")
 
 
 class EchoAgentServerTest(unittest.TestCase):
@@ -80,9 +93,10 @@ class EchoAgentServerTest(unittest.TestCase):
 class MockClientTest(unittest.TestCase):
     """Integration test with a simple mock instead of patching."""
 
-    def setUp(self):
-        """Set up the test environment."""
-        self.client = AgentClient(timeout=5)
+    @classmethod
+    def setUpClass(cls):
+        """Set up one client shared by every test in the class."""
+        cls.client = AgentClient(timeout=5)
 
     def test_mock_invocation(self):
         """Test a mocked response for the echo capability."""
@@ -114,12 +128,99 @@ class MockClientTest(unittest.TestCase):
         self.assertEqual(response["timestamp"], test_timestamp)
 
 
+class BatchInvocationTest(unittest.TestCase):
+    """Test batched invocations against the standalone echo server."""
+
+    def test_mixed_batch_is_rejected_with_422(self):
+        """Test an unknown capability in a batch is not reported as 404."""
+        client = TestClient(standalone_app)
+        calls = [
+            {"capability": "echo", "params": {"message": "hi"}},
+            {"capability": "missing", "params": {}},
+        ]
+
+        response = client.post("/_batch", json=calls)
+
+        self.assertEqual(response.status_code, 422)
+        self.assertIn("call 1", response.json()["detail"])
+
+    def test_invoke_batch_raises_instead_of_falling_back(self):
+        """Test only a missing batch route falls back to individual calls."""
+        transport = HttpTransport()
+        self.addCleanup(transport.close)
+        calls = [("echo", {"message": "hi"}), ("missing", {})]
+        endpoint = "agent+http://localhost:8765"
+
+        with (
+            mock.patch.object(
+                transport, "_post", side_effect=AgentHTTPError(422, "bad", endpoint)
+            ),
+            mock.patch.object(transport, "invoke", new=mock.AsyncMock()) as invoke,
+        ):
+            with self.assertRaises(AgentHTTPError):
+                asyncio.run(transport.invoke_batch(endpoint, calls))
+            invoke.assert_not_awaited()
+
+        with (
+            mock.patch.object(
+                transport, "_post", side_effect=AgentHTTPError(404, "", endpoint)
+            ),
+            mock.patch.object(transport, "invoke", new=mock.AsyncMock()) as invoke,
+        ):
+            asyncio.run(transport.invoke_batch(endpoint, calls))
+            self.assertEqual(invoke.await_count, 2)
+
+
+class HttpTransportErrorTest(unittest.TestCase):
+    """Test HttpTransport raises the same exception types as requests."""
+
+    def setUp(self):
+        """Create a transport whose session returns a canned response."""
+        self.transport = HttpTransport()
+        self.addCleanup(self.transport.close)
+        self.response = requests.Response()
+        self.response.url = "http://localhost:8765/echo"
+        patcher = mock.patch.object(
+            self.transport._session, "post", return_value=self.response
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def invoke(self):
+        """Invoke the echo capability through the transport."""
+        return asyncio.run(
+            self.transport.invoke("agent+http://localhost:8765", "echo", {})
+        )
+
+    def test_http_error_status_is_a_requests_http_error(self):
+        """Test error statuses raise an HTTPError carrying the response."""
+        self.response.status_code = 500
+        self.response._content = b"boom"
+
+        with self.assertRaises(requests.exceptions.HTTPError) as cm:
+            self.invoke()
+
+        self.assertIsInstance(cm.exception, AgentHTTPError)
+        self.assertIs(cm.exception.response, self.response)
+        self.assertEqual(cm.exception.status_code, 500)
+
+    def test_undecodable_body_is_a_request_exception(self):
+        """Test a non-JSON success body raises like response.json()."""
+        self.response.status_code = 200
+        self.response._content = b"not json"
+
+        with self.assertRaises(requests.exceptions.JSONDecodeError):
+            self.invoke()
+
+
 def register_http_transport():
     """Register our custom HTTP transport with the global registry."""
-    transport = HttpTransport()
+    # The registry builds its own instance to read the protocol, so there
+    # is no need to construct (and open a session for) another one here
     default_registry.register_transport(HttpTransport)
-    print(f"Registered HTTP transport for protocol '{transport.protocol}'")
-    print(f"Supported protocols: {default_registry.list_supported_protocols()}")
+    protocols = default_registry.list_supported_protocols()
+    print("Registered HTTP transport")
+    print(f"Supported protocols: {protocols}")
 
 
 if __name__ == "__main__":
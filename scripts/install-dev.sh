@@ -161,15 +161,17 @@ except ImportError as e:
     echo -e "${GREEN}✓ Package imports working${RESET}"
 fi
 
-# Test development tools
+# Test development tools in one uv run, rather than paying uv's environment
+# check and startup once per tool
 echo -e "${BLUE}   Testing development tools...${RESET}"
+GREEN="$GREEN" YELLOW="$YELLOW" RESET="$RESET" uv run bash -c '
 for tool in pytest black isort mypy flake8; do
-    if uv run "$tool" --version >/dev/null 2>&1; then
+    if "$tool" --version >/dev/null 2>&1; then
         echo -e "${GREEN}✓ $tool is working${RESET}"
     else
         echo -e "${YELLOW}⚠️  $tool may have issues${RESET}"
     fi
-done
+done' || echo -e "${YELLOW}⚠️  Could not check development tools${RESET}"
 
 # Show environment info
 echo -e "${BLUE}📊 Environment Information:${RESET}"
@@ -192,4 +194,4 @@ echo -e "   • Use ${YELLOW}'poetry run <command>'${RESET} for Poetry-managed e
 echo -e "   • Use ${YELLOW}'make help'${RESET} to see all available commands"
 echo -e "   • Pre-commit hooks will run automatically on git commit"
 
-echo -e "${GREEN}✨ Happy coding!${RESET}"
+echo -e "${GREEN}✨ Happy coding!${RESET}"